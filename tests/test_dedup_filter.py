@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+"""DedupFilter: exact set, Bloom chain, and the save/load round trip."""
+
+import pytest
+
+from we_we_we.dedup_filter import DedupFilter
+
+
+def _filled() -> DedupFilter:
+    seen = DedupFilter(exact_max=100, error_rate=1e-3)
+    for i in range(2000):  # 100 exact keys, the rest across a chain of Bloom filters
+        seen.add(f"payload {i}")
+    seen.add("payload 7")
+    return seen
+
+
+def test_add_reports_repeats():
+    seen = DedupFilter()
+    assert (seen.add("dlrow olleh"), seen.add("dlrow olleh")) == (True, False)
+    assert "dlrow olleh" in seen and "olleh" not in seen
+    assert (len(seen), seen.duplicates) == (1, 1)
+
+
+def test_save_load_round_trip(tmp_path):
+    seen = _filled()
+    assert seen.stats()["filters"] > 1
+    path = tmp_path / "ingest.seen"
+    seen.save(path)
+    assert not seen.dirty
+    loaded = DedupFilter.load(path, exact_max=100)
+    assert loaded.stats() == seen.stats()
+    assert all(f"payload {i}" in loaded for i in range(2000))
+    assert loaded.error_rate == seen.error_rate
+
+
+def test_load_missing_file_is_empty(tmp_path):
+    assert len(DedupFilter.load(tmp_path / "nope.seen")) == 0
+
+
+@pytest.mark.parametrize("keep", [0, 5, 40, -1])
+def test_load_truncated_file_raises(tmp_path, keep):
+    path = tmp_path / "ingest.seen"
+    _filled().save(path)
+    data = path.read_bytes()
+    path.write_bytes(data[:keep])
+    with pytest.raises(ValueError, match="corrupt dedup state"):
+        DedupFilter.load(path)
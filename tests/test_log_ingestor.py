@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+"""Reversed-line prefilter, and unterminated last lines: read once settled, never cut off."""
+
+import os
+import random
+import time
+
+from we_we_we.log_ingestor import _COMMON_WORDS, _candidates, _is_likely_reversed, follow, ingest
+from we_we_we.memory_palace import get_palace
+
+FIRST = "the cat is in the house"[::-1]
+LAST = "and the dog is on the roof"[::-1]
+
+
+# reversed common words, their look-alikes under lower(), and the separators str.split honours
+_PIECES = sorted(w[::-1] for w in _COMMON_WORDS) + [
+    "EHT", "Dna", "UOY", "ew", "xeht", "eht'", "fo.", "ni", "si", "abc", "7",
+    "\u0130", "\u0131", "\u017f", "\u212a", "\u212aeht",
+]
+_GAPS = [" ", " ", "  ", "\t", "\x1f", "\xa0", "\u3000", "", ".", ","]
+
+
+def test_prefilter_keeps_every_line_the_heuristic_accepts():
+    rng = random.Random(22)
+    for _ in range(3000):
+        lines = [
+            "".join(rng.choice(_PIECES) + rng.choice(_GAPS) for _ in range(rng.randint(0, 6)))
+            for _ in range(rng.randint(1, 8))
+        ]
+        expected = [i for i, line in enumerate(lines) if _is_likely_reversed(line[::-1])]
+        candidates = list(_candidates(lines))
+        assert candidates == sorted(set(candidates))
+        assert [i for i in candidates if _is_likely_reversed(lines[i][::-1])] == expected
+
+
+def _write(tmp_path, monkeypatch, text):
+    monkeypatch.chdir(tmp_path)  # palace and checkpoints land next to the log
+    log = tmp_path / "app.log"
+    log.write_text(text)
+    return log
+
+
+def _age(log, seconds=3600):
+    past = time.time() - seconds
+    os.utime(log, (past, past))
+
+
+def _stored(tmp_path):
+    return sorted(a.text for a in get_palace(tmp_path / ".we_memory.json").search("decoded"))
+
+
+def _reference(text, tmp_path):
+    """Texts a checkpoint-free run stores for *text*, in a palace of their own."""
+
+    scratch = tmp_path / "scratch"
+    scratch.mkdir(exist_ok=True)
+    (scratch / "ref.log").write_text(text)
+    cwd = os.getcwd()
+    os.chdir(scratch)
+    try:
+        ingest([str(scratch / "ref.log")], checkpoint=False)
+        return [a.text for a in get_palace(scratch / ".we_memory.json").search("decoded")]
+    finally:
+        os.chdir(cwd)
+
+
+def test_one_shot_reads_settled_unterminated_last_line(tmp_path, monkeypatch):
+    log = _write(tmp_path, monkeypatch, f"{FIRST}\nnoise 123 456\n{LAST}")  # no trailing newline
+    _age(log)
+    plain = ingest([str(log)], checkpoint=False, dedup=False)
+    stats = ingest([str(log)])  # checkpointed; the first run starts from scratch
+    assert stats["decoded"] == plain["decoded"] == 2
+    assert stats["lines"] == 3
+    assert ingest([str(log)])["unchanged"] == 1
+
+
+def test_line_being_written_is_stored_whole(tmp_path, monkeypatch):
+    log = _write(tmp_path, monkeypatch, f"{FIRST}\n{LAST[:12]}")
+    assert ingest([str(log)])["decoded"] == 1  # mid-write: the partial line waits
+    with log.open("a") as f:
+        f.write(f"{LAST[12:]}\n")
+    assert ingest([str(log)])["decoded"] == 1
+    assert _stored(tmp_path) == sorted(_reference(f"{FIRST}\n{LAST}\n", tmp_path))
+
+
+def test_settled_line_that_grows_is_read_again_in_full(tmp_path, monkeypatch):
+    log = _write(tmp_path, monkeypatch, f"{FIRST}\n{LAST}")
+    assert ingest([str(log)], settle=0)["decoded"] == 2
+    with log.open("a") as f:
+        f.write(" won\n")
+    assert ingest([str(log)], settle=0)["decoded"] == 1
+    assert set(_reference(f"{LAST} won\n", tmp_path)) <= set(_stored(tmp_path))
+
+
+def test_follow_reads_last_line_once_settled(tmp_path, monkeypatch):
+    log = _write(tmp_path, monkeypatch, f"{FIRST}\n{LAST}")
+    passes = follow([str(log)], interval=0)
+    assert next(passes)["decoded"] == 1  # the last line may still be written to
+    assert next(passes)["unchanged"] == 1
+    _age(log)
+    assert next(passes)["decoded"] == 1
+    passes.close()
+    rerun = ingest([str(log)])
+    assert (rerun["decoded"], rerun["unchanged"]) == (0, 1)
+    assert len(_stored(tmp_path)) == 2
+
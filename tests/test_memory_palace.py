@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+"""Palace storage: JsonBackend journal replay, compaction, torn records, cross-handle
+refresh and corrupt snapshots, plus the PalaceBackend interface."""
+
+import pytest
+
+from we_we_we.memory_palace import JsonBackend, MemoryPalace, PalaceBackend
+
+LONG = "the candy of void " * 20  # stored as a blob, not inline
+
+
+def _texts(palace: MemoryPalace) -> list:
+    return [a.text for a in palace.all()]
+
+
+def test_journal_replays_in_order(tmp_path):
+    path = tmp_path / "p.json"
+    palace = MemoryPalace(path)
+    first = palace.add("dushi", "sugar")
+    palace.add_many(["noon", LONG], "loop")
+    palace.backend.delete([first.id])
+    assert not path.exists()  # nothing compacted yet: all of it is in the journal
+    reopened = MemoryPalace(path)
+    assert _texts(reopened) == ["noon", LONG]
+    assert [a.text for a in reopened.search("loop")] == ["noon", LONG]
+    assert reopened.search("sugar") == []
+
+
+def test_compact_folds_journal_into_snapshot(tmp_path):
+    path = tmp_path / "p.json"
+    palace = MemoryPalace(path)
+    palace.add_many([f"line {i}" for i in range(50)] + [LONG], "bulk")
+    palace.compact()
+    assert palace.backend.journal_path.stat().st_size == 0
+    palace.add("after", "bulk")
+    reopened = MemoryPalace(path)
+    assert _texts(reopened) == [f"line {i}" for i in range(50)] + [LONG, "after"]
+
+
+def test_torn_trailing_record_is_skipped(tmp_path):
+    path = tmp_path / "p.json"
+    MemoryPalace(path).add_many(["one", "two"], "t")
+    journal = JsonBackend(path).journal_path
+    with journal.open("ab") as f:
+        f.write(b'{"id": "torn", "text": "thr')  # a writer died mid-record
+    assert _texts(MemoryPalace(path)) == ["one", "two"]
+
+
+def test_refresh_picks_up_other_handles_writes(tmp_path):
+    path = tmp_path / "p.json"
+    writer, reader = MemoryPalace(path), MemoryPalace(path)
+    assert reader.refresh() is False
+    writer.add("dushi", "sugar")
+    assert reader.refresh() is True
+    assert [a.text for a in reader.search("sugar")] == ["dushi"]
+    assert reader.refresh() is False
+    writer.add("noon", "sugar")
+    writer.compact()  # snapshot replaced, journal emptied
+    assert reader.refresh() is True
+    assert [a.text for a in reader.search("sugar")] == ["dushi", "noon"]
+
+
+def test_writer_isolates_torn_record(tmp_path):
+    path = tmp_path / "p.json"
+    reader = MemoryPalace(path)
+    with JsonBackend(path).journal_path.open("ab") as f:
+        f.write(b'{"id": "torn", "text": "thr')  # left by a process that died mid-append
+    writer = MemoryPalace(path)
+    writer.add("after", "t")
+    reader.refresh()
+    assert _texts(reader) == ["after"]
+    assert _texts(MemoryPalace(path)) == ["after"]
+
+
+def test_corrupt_snapshot_raises(tmp_path):
+    path = tmp_path / "p.json"
+    palace = MemoryPalace(path)
+    palace.add("dushi", "sugar")
+    palace.compact()
+    path.write_text(path.read_text("utf-8")[:-5], "utf-8")  # cut short
+    with pytest.raises(ValueError, match="corrupt palace snapshot"):
+        MemoryPalace(path)
+
+
+def test_incomplete_backend_fails_on_creation():
+    class PutOnly(PalaceBackend):
+        def put(self, artefacts):
+            pass
+
+    with pytest.raises(TypeError, match="abstract"):
+        PutOnly()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+"""VibeAnalyzer fed or merged at random chunk boundaries reports what analyze_text does;
+the result cache's disk tier stays within its budget."""
+
+import random
+
+import pytest
+
+from we_we_we.lexicon import Lexicon, set_lexicon
+from we_we_we.vibe_sensor import VibeAnalyzer, VibeCache, analyze_text
+
+_PIECES = [
+    "we", "WE", "dushi", "Dushi", "noon", "level", "sksksk", "asdfghjk", "jajaja", "mmm",
+    "candy of void", "ΟΔΟΣ", "İstanbul", "don't", "!!!", "???", "...", "aaaa", "x", "7",
+    " ", "  ", "\n", "\t", "\r\n", ", ", " ", "　",
+]
+
+
+def _text(rng: random.Random) -> str:
+    size = rng.choice((20, 300, 3000))  # 3000 pieces repeat tokens past the alert threshold
+    return "".join(rng.choice(_PIECES) for _ in range(rng.randint(0, size)))
+
+
+def _cuts(rng: random.Random, text: str) -> list:
+    bounds = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, rng.randint(0, 12))))
+    return [text[a:b] for a, b in zip([0, *bounds], [*bounds, len(text)])]
+
+
+@pytest.fixture(params=[(), ("candy of void", "we we we", "don't stop")], ids=["plain", "phrases"])
+def lexicon(request):
+    lex = set_lexicon(Lexicon(alert_phrases=request.param))
+    yield lex
+    set_lexicon(None)
+
+
+def test_feed_matches_analyze_text(lexicon):
+    rng = random.Random(47)
+    for _ in range(300):
+        text = _text(rng)
+        analyzer = VibeAnalyzer()
+        for piece in _cuts(rng, text):
+            analyzer.feed(piece)
+        assert analyzer.report() == analyze_text(text)
+
+
+def test_merge_matches_analyze_text(lexicon):
+    rng = random.Random(48)
+    for _ in range(300):
+        text = _text(rng)
+        total = VibeAnalyzer()
+        for piece in _cuts(rng, text):
+            part = VibeAnalyzer()
+            for sub in _cuts(rng, piece):
+                part.feed(sub)
+            total.merge(part)
+        assert total.report() == analyze_text(text)
+
+
+def test_merge_rejects_other_lexicon():
+    with pytest.raises(ValueError):
+        VibeAnalyzer(Lexicon()).merge(VibeAnalyzer(Lexicon(alert_phrases=["we we"])))
+
+
+def test_disk_tier_stays_within_budget(tmp_path):
+    cache = VibeCache(max_entries=10, disk_dir=tmp_path, disk_max_bytes=20_000)
+    reports = {}
+    for i in range(500):
+        reports[i] = analyze_text(f"message {i}")
+        cache.put(f"{i:064x}", reports[i])
+    on_disk = sum(p.stat().st_size for p in tmp_path.rglob("*.json"))
+    assert on_disk <= 20_000
+    assert cache.stats()["disk_bytes"] == on_disk
+    assert cache.stats()["disk_evictions"] > 0
+    fresh = VibeCache(disk_dir=tmp_path, disk_max_bytes=20_000)
+    assert fresh.stats()["disk_bytes"] == on_disk
+    assert fresh.get(f"{499:064x}") == reports[499]  # newest files survive
+    assert fresh.get(f"{0:064x}") is None  # oldest were pruned
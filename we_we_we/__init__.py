@@ -10,7 +10,16 @@ __all__ = [
 
 __version__ = "0.1.0"
 
-from .vibe_sensor import analyze_text  # noqa: F401
+from .vibe_sensor import (  # noqa: F401
+    VibeAnalyzer,
+    analyze_corpus,
+    analyze_many,
+    analyze_text,
+    disable_cache,
+    enable_cache,
+)
+from .vibe_batch import VibeReportBatch  # noqa: F401
+from .lexicon import Lexicon, load_lexicon, set_lexicon, watch_lexicon  # noqa: F401
 __all__.append("RemixKernel")
 
 from .remix_kernel import RemixKernel  # noqa: E402
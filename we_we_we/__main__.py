@@ -2,15 +2,19 @@ import sys
 import json
 from pathlib import Path
 
-from .vibe_sensor import analyze_text
+from .vibe_sensor import VibeAnalyzer, analyze_text
+
+_STDIN_CHUNK = 1 << 20  # characters
 
 
 def main() -> None:
     if len(sys.argv) > 1:
-        text = " ".join(sys.argv[1:])
+        report = analyze_text(" ".join(sys.argv[1:]))
     else:
-        text = sys.stdin.read()
-    report = analyze_text(text)
+        analyzer = VibeAnalyzer()
+        for chunk in iter(lambda: sys.stdin.read(_STDIN_CHUNK), ""):
+            analyzer.feed(chunk)
+        report = analyzer.report()
     print(json.dumps(report.to_dict(), indent=2))
 
 
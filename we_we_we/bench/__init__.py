@@ -0,0 +1,9 @@
+"""bench – benchmarks and synthetic corpora for the WE-WE-WE toolkit.
+
+* ``python -m we_we_we.bench run -o results.json`` – per-subsystem suite
+  (see :mod:`we_we_we.bench.suite`)
+* ``python -m we_we_we.bench compare old.json new.json`` – regression check
+* ``python -m we_we_we.bench.vibe`` – fused vs. legacy ``analyze_text``
+* ``python -m we_we_we.bench.stress`` – 16 processes writing one palace
+* :mod:`we_we_we.bench.corpus` – reproducible input generator
+"""
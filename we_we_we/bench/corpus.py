@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+"""bench.corpus – reproducible synthetic inputs for the benchmark suite.
+
+Every generator takes a ``seed`` so two runs (or two releases) see the exact
+same text. Kinds:
+
+* ``keysmash``  – frantic letter runs and repeated punctuation
+* ``sugar``     – Papiamentu sugar-heavy chatter
+* ``reversed``  – appliance log lines, some carrying a reversed payload
+* ``task``      – ``TASK:`` / ``TODO:`` lines as picked up by the task manager
+* ``jargon``    – corporate cloak phrases (and their playful originals)
+"""
+
+import random
+from pathlib import Path
+from typing import Callable, Dict, List
+
+__all__ = ["KINDS", "generate", "write_log"]
+
+_SUGAR = "dushi ayó bon bini kon bo ta kla plase sinti jajajaja mmm mmmm we".split()
+_PLAIN = "the candy of void wifi listen keep screaming frog glitch manifest soundtrack".split()
+_SMASH = "sksksksk asdfghjkl dfghjk qwzxcvbn ghjkasdf lkjhgf".split()
+_PAYLOADS = [
+    "we keep the candy and the frog in the void",
+    "you and we listen to the wifi",
+    "the manifest is in the soundtrack of we",
+    "to the glitch and back is the way of you",
+]
+_VERBS = "Merge Remix Archive Sweeten Decode Publish Hum Loop".split()
+_JARGON = [
+    "Quantum Emotional Resonance Event (QERE)",
+    "Synchronous Stakeholder Alignment (SSA)",
+    "Post-Incident Reflective Uplift Cycle (PIRUC)",
+    "Micro-Meditative Breath Cycle (MMBC)",
+    "jajajaja",
+    "we we we",
+    "lamentwave",
+    "containment fiction",
+]
+
+
+def _keysmash(rng: random.Random) -> str:
+    parts = [rng.choice(_SMASH + _PLAIN) for _ in range(rng.randint(3, 12))]
+    return " ".join(parts) + rng.choice(["!!!", "???", "...", "!?!?", ""])
+
+
+def _sugar(rng: random.Random) -> str:
+    return " ".join(rng.choice(_SUGAR + _SUGAR + _PLAIN) for _ in range(rng.randint(4, 16)))
+
+
+def _reversed(rng: random.Random) -> str:
+    if rng.random() < 0.2:
+        return rng.choice(_PAYLOADS)[::-1]
+    ts = f"2025-01-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}"
+    return f"{ts} appliance[{rng.randint(100, 999)}] temp={rng.uniform(2, 9):.1f}C door=closed"
+
+
+def _task(rng: random.Random) -> str:
+    prefix = rng.choice(["TASK:", "TODO:", "task:", "[task]"])
+    return f"{prefix} {rng.choice(_VERBS)} the {rng.choice(_PLAIN)} with the {rng.choice(_PLAIN)}."
+
+
+def _jargon(rng: random.Random) -> str:
+    return " and ".join(rng.choice(_JARGON) for _ in range(rng.randint(1, 4)))
+
+
+KINDS: Dict[str, Callable[[random.Random], str]] = {
+    "keysmash": _keysmash,
+    "sugar": _sugar,
+    "reversed": _reversed,
+    "task": _task,
+    "jargon": _jargon,
+}
+
+
+def generate(kind: str, n: int, *, seed: int = 47) -> List[str]:
+    """Return *n* lines of *kind* (see :data:`KINDS`)."""
+
+    make = KINDS[kind]
+    rng = random.Random(f"{kind}:{seed}")
+    return [make(rng) for _ in range(n)]
+
+
+def write_log(path: Path, n: int, *, seed: int = 47) -> Path:
+    """Write *n* appliance log lines (some reversed payloads) to *path*."""
+
+    path.write_text("\n".join(generate("reversed", n, seed=seed)) + "\n", "utf-8")
+    return path
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+"""bench.stress – many processes writing one Memory Palace at once.
+
+CLI
+───
+$ python -m we_we_we.bench.stress                       # 16 writers, JSON palace
+$ python -m we_we_we.bench.stress --backend sqlite --writers 16 --records 5000
+
+Every writer process adds *records* artefacts (single ``add`` calls mixed with
+``add_many`` chunks) while reader processes keep calling ``refresh``.  When
+all are done a fresh palace is opened and checked: every record present
+exactly once, ids unique.  Texts mix short inline bodies, long unique ones
+and one long body every writer repeats, so the blob pack is exercised too.
+Exits non-zero on any loss or duplicate, and prints the aggregate write
+throughput.
+"""
+
+import argparse
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from ..memory_palace import MemoryPalace
+
+__all__ = ["run", "verify"]
+
+_CHUNK = 50  # records per add_many call; every other call is a single add
+_PADDING = " ".join(["mmm dushi lullaby for the frog glitch"] * 4)  # odd records go to the blob pack
+
+
+def _text(tag: str, i: int) -> str:
+    if i % 10 == 0:
+        return _PADDING  # the same body from every writer: stored once
+    return f"{tag}:{i} {_PADDING}" if i % 2 else f"{tag}:{i}"
+
+
+# ----------------------------------------------------------------- workers
+
+def _writer(path: str, backend: str, writer: int, records: int, start: float) -> None:
+    palace = MemoryPalace(Path(path), backend=backend)
+    tag = f"w{writer}"
+    while time.time() < start:
+        time.sleep(0.001)
+    i = 0
+    while i < records:
+        if (i // _CHUNK) % 2:
+            n = min(_CHUNK, records - i)
+            palace.add_many([_text(tag, j) for j in range(i, i + n)], "stress", tag)
+            i += n
+        else:
+            palace.add(_text(tag, i), "stress", tag)
+            i += 1
+    palace.close()
+
+
+def _reader(path: str, backend: str, stop: float) -> None:
+    palace = MemoryPalace(Path(path), backend=backend)
+    while time.time() < stop:
+        palace.refresh()
+        len(palace)
+        time.sleep(0.005)
+    palace.close()
+
+
+# ------------------------------------------------------------------ checks
+
+def verify(path: Path, backend: str, writers: int, records: int) -> List[str]:
+    """Return problems found in a palace written by :func:`run` (empty if none)."""
+
+    palace = MemoryPalace(path, backend=backend)
+    seen: Dict[Tuple[str, str], int] = {}
+    ids = set()
+    problems: List[str] = []
+    for art in palace.all():
+        if art.id in ids:
+            problems.append(f"duplicate id {art.id}")
+        ids.add(art.id)
+        key = (art.tags[-1], art.text)
+        seen[key] = seen.get(key, 0) + 1
+    palace.close()
+    for w in range(writers):
+        tag = f"w{w}"
+        expected: Dict[str, int] = {}
+        for i in range(records):
+            text = _text(tag, i)
+            expected[text] = expected.get(text, 0) + 1
+        for text, count in expected.items():
+            if seen.get((tag, text), 0) != count:
+                problems.append(f"{tag}: {text[:24]!r} stored {seen.get((tag, text), 0)} times, expected {count}")
+    return problems
+
+
+def run(directory: Path, *, writers: int = 16, records: int = 2_000, readers: int = 2, backend: str = "json") -> Dict[str, object]:
+    """Hammer a palace in *directory* and return throughput plus any problems."""
+
+    path = directory / ("palace.db" if backend == "sqlite" else ".we_memory.json")
+    MemoryPalace(path, backend=backend).close()  # create the store up front
+    ctx = multiprocessing.get_context("spawn")
+    start = time.time() + 1.0  # let every process finish importing first
+    procs = [ctx.Process(target=_writer, args=(str(path), backend, w, records, start)) for w in range(writers)]
+    for p in procs:
+        p.start()
+    readers_procs = [
+        ctx.Process(target=_reader, args=(str(path), backend, start + 60.0)) for _ in range(readers)
+    ]
+    for p in readers_procs:
+        p.start()
+    for p in procs:
+        p.join()
+    elapsed = time.time() - start
+    for p in readers_procs:
+        p.terminate()
+        p.join()
+    failed = [f"writer {w} exited with {p.exitcode}" for w, p in enumerate(procs) if p.exitcode]
+    total = writers * records
+    return {
+        "backend": backend,
+        "writers": writers,
+        "records": total,
+        "seconds": elapsed,
+        "records_per_s": total / elapsed if elapsed > 0 else 0.0,
+        "problems": failed + verify(path, backend, writers, records),
+    }
+
+
+# -------------------------------------------------------------------- CLI
+
+def _main() -> None:  # pragma: no cover
+    parser = argparse.ArgumentParser(description="Concurrent-writer stress test for the Memory Palace.")
+    parser.add_argument("--writers", type=int, default=16)
+    parser.add_argument("--records", type=int, default=2_000, help="artefacts per writer")
+    parser.add_argument("--readers", type=int, default=2)
+    parser.add_argument("--backend", choices=("json", "sqlite"), default="json")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="we_stress_") as tmp:
+        result = run(Path(tmp), writers=args.writers, records=args.records, readers=args.readers, backend=args.backend)
+    print(
+        f"{result['backend']}: {result['records']} records from {result['writers']} writers "
+        f"in {result['seconds']:.2f}s ({result['records_per_s']:.0f} records/s)"
+    )
+    for line in result["problems"][:20]:
+        print(f"PROBLEM {line}")
+    if result["problems"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    _main()
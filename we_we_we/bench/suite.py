@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+"""bench.suite – per-subsystem benchmarks with JSON results and regression checks.
+
+CLI
+───
+$ python -m we_we_we.bench run -o before.json            # all subsystems
+$ python -m we_we_we.bench run -o after.json --only vibe.analyze_text,palace.add
+$ python -m we_we_we.bench compare before.json after.json --threshold 0.10
+
+Each benchmark runs in a fresh (spawned) process inside a temporary working
+directory, so ``.we_memory.json`` / bus files never touch the real ones and
+peak RSS is measured per subsystem.  Results record ops/s, p50/p99 latency
+(µs) and peak RSS (KiB).  ``compare`` exits non-zero when throughput, p99 or
+RSS got worse than *threshold* (relative).
+
+Ops/s counts only the timed operations, so setup such as filling a palace
+first does not dilute it.
+"""
+
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from .corpus import generate
+
+__all__ = ["BENCHMARKS", "compare", "run"]
+
+
+# ------------------------------------------------------------- benchmarks
+# each returns per-operation latencies in nanoseconds
+
+def _timed(op: Callable[[str], object], items: List[str]) -> List[int]:
+    clock = time.perf_counter_ns
+    lat: List[int] = []
+    for item in items:
+        t0 = clock()
+        op(item)
+        lat.append(clock() - t0)
+    return lat
+
+
+def _timed_iter(it: Iterator[object]) -> List[int]:
+    clock = time.perf_counter_ns
+    lat: List[int] = []
+    t0 = clock()
+    for _ in it:
+        t1 = clock()
+        lat.append(t1 - t0)
+        t0 = t1
+    return lat
+
+
+def _mixed(n: int, seed: int) -> List[str]:
+    per = max(1, n // 3)
+    return (
+        generate("keysmash", per, seed=seed)
+        + generate("sugar", per, seed=seed)
+        + generate("jargon", n - 2 * per, seed=seed)
+    )
+
+
+def bench_analyze_text(n: int, seed: int) -> List[int]:
+    from ..vibe_sensor import analyze_text
+
+    return _timed(analyze_text, _mixed(n, seed))
+
+
+def bench_palace_add(n: int, seed: int) -> List[int]:
+    from ..memory_palace import MemoryPalace
+
+    palace = MemoryPalace(Path(".we_memory.json"))
+    return _timed(lambda text: palace.add(text, "bench"), generate("task", n, seed=seed))
+
+
+def bench_palace_add_many(n: int, seed: int) -> List[int]:
+    from ..memory_palace import MemoryPalace
+
+    palace = MemoryPalace(Path(".we_memory.json"))
+    texts = generate("task", n, seed=seed)
+    chunks = [texts[i : i + 1000] for i in range(0, n, 1000)]
+    lat = _timed(lambda chunk: palace.add_many(chunk, "bench"), chunks)
+    # one sample per record, so ops/s reads as records per second
+    return [ns // len(chunk) for ns, chunk in zip(lat, chunks) for _ in chunk]
+
+
+def bench_palace_open(n: int, seed: int) -> List[int]:
+    from ..memory_palace import get_palace
+
+    get_palace().add_many(generate("task", 50_000, seed=seed), "bench")  # sizeable palace
+    return _timed(lambda _: get_palace(), [""] * n)
+
+
+def bench_palace_find(n: int, seed: int) -> List[int]:
+    from ..memory_palace import MemoryPalace
+
+    palace = MemoryPalace(Path("palace.db"))
+    palace.add_many(generate("task", 20_000, seed=seed), "bench")
+    queries = ["merge", '"frog glitch"', "cand*", "sweeten wifi", '"the manifest"']
+    return _timed(palace.find, [queries[i % len(queries)] for i in range(n)])
+
+
+def bench_bus_consume(n: int, seed: int) -> List[int]:
+    from ..quantum_bus import QuantumBus
+
+    sender = QuantumBus("🤝", base_path=Path("."))
+    for i, line in enumerate(generate("sugar", n, seed=seed)):
+        sender.send_tick({"i": i, "text": line})
+    receiver = QuantumBus("🤝", base_path=Path("."))
+    return _timed_iter(receiver.consume(follow=False))
+
+
+def bench_cloak(n: int, seed: int) -> List[int]:
+    from ..cloak_translator import cloak
+
+    return _timed(cloak, generate("jargon", n, seed=seed))
+
+
+def bench_reveal(n: int, seed: int) -> List[int]:
+    from ..cloak_translator import cloak, reveal
+
+    return _timed(reveal, [cloak(t) for t in generate("jargon", n, seed=seed)])
+
+
+def bench_remix(n: int, seed: int) -> List[int]:
+    from ..remix_kernel import RemixKernel
+
+    kernel = RemixKernel()
+    return _timed(kernel.remix, _mixed(n, seed))
+
+
+BENCHMARKS: Dict[str, Tuple[Callable[[int, int], List[int]], int]] = {
+    "vibe.analyze_text": (bench_analyze_text, 20_000),
+    "palace.add": (bench_palace_add, 500),
+    "palace.add_many": (bench_palace_add_many, 50_000),
+    "palace.open": (bench_palace_open, 5_000),
+    "palace.find": (bench_palace_find, 2_000),
+    "bus.consume": (bench_bus_consume, 20_000),
+    "cloak.cloak": (bench_cloak, 20_000),
+    "cloak.reveal": (bench_reveal, 20_000),
+    "remix.remix": (bench_remix, 5_000),
+}
+
+
+# ----------------------------------------------------------------- runner
+
+def _percentile(sorted_ns: List[int], q: float) -> float:
+    if not sorted_ns:
+        return 0.0
+    idx = min(len(sorted_ns) - 1, max(0, round(q / 100 * (len(sorted_ns) - 1))))
+    return sorted_ns[idx] / 1000
+
+
+def _run_one(name: str, n: int, seed: int) -> Dict[str, float]:
+    fn, _ = BENCHMARKS[name]
+    with tempfile.TemporaryDirectory(prefix="we_bench_") as tmp:
+        os.chdir(tmp)
+        lat = fn(n, seed)
+    lat.sort()
+    measured = sum(lat) / 1e9  # the timed operations only, not corpus generation or pre-filling
+    return {
+        "ops": len(lat),
+        "ops_per_s": len(lat) / measured if measured else 0.0,
+        "p50_us": _percentile(lat, 50),
+        "p99_us": _percentile(lat, 99),
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def run(names: List[str] | None = None, *, scale: float = 1.0, seed: int = 47) -> Dict[str, object]:
+    """Run the selected benchmarks (default: all) and return the result document."""
+
+    ctx = multiprocessing.get_context("spawn")
+    results: Dict[str, Dict[str, float]] = {}
+    for name in names or list(BENCHMARKS):
+        n = max(1, int(BENCHMARKS[name][1] * scale))
+        with ctx.Pool(1) as pool:
+            results[name] = pool.apply(_run_one, (name, n, seed))
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+            "seed": seed,
+            "scale": scale,
+        },
+        "results": results,
+    }
+
+
+def compare(old: Dict[str, object], new: Dict[str, object], *, threshold: float = 0.10) -> List[str]:
+    """Return human-readable regression lines between two result documents."""
+
+    regressions: List[str] = []
+    old_res = old.get("results", {})
+    new_res = new.get("results", {})
+    for name in sorted(set(old_res) & set(new_res)):
+        a, b = old_res[name], new_res[name]
+        if a["ops_per_s"] and b["ops_per_s"] < a["ops_per_s"] * (1 - threshold):
+            regressions.append(f"{name}: ops/s {a['ops_per_s']:.0f} -> {b['ops_per_s']:.0f}")
+        for key in ("p99_us", "peak_rss_kb"):
+            if a[key] and b[key] > a[key] * (1 + threshold):
+                regressions.append(f"{name}: {key} {a[key]:.1f} -> {b[key]:.1f}")
+    return regressions
+
+
+# -------------------------------------------------------------------- CLI
+
+def _print_table(doc: Dict[str, object]) -> None:
+    print(f"{'benchmark':<20} {'ops':>8} {'ops/s':>12} {'p50 µs':>10} {'p99 µs':>10} {'RSS KiB':>10}")
+    for name, r in doc["results"].items():
+        print(
+            f"{name:<20} {r['ops']:>8} {r['ops_per_s']:>12.0f} {r['p50_us']:>10.1f} "
+            f"{r['p99_us']:>10.1f} {r['peak_rss_kb']:>10}"
+        )
+
+
+def _main(argv: List[str] | None = None) -> None:  # pragma: no cover
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m we_we_we.bench", description="WE-WE-WE benchmark suite.")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_run = sub.add_parser("run", help="run benchmarks and write JSON results")
+    p_run.add_argument("-o", "--out", help="write results to this JSON file")
+    p_run.add_argument("--only", help="comma-separated benchmark names")
+    p_run.add_argument("--scale", type=float, default=1.0, help="multiply default op counts")
+    p_run.add_argument("--seed", type=int, default=47)
+    p_cmp = sub.add_parser("compare", help="flag regressions between two result files")
+    p_cmp.add_argument("old")
+    p_cmp.add_argument("new")
+    p_cmp.add_argument("--threshold", type=float, default=0.10, help="relative tolerance (default 0.10)")
+    args = parser.parse_args(argv)
+
+    if args.cmd == "run":
+        names = args.only.split(",") if args.only else None
+        unknown = [n for n in names or [] if n not in BENCHMARKS]
+        if unknown:
+            parser.error(f"unknown benchmarks: {', '.join(unknown)} (have: {', '.join(BENCHMARKS)})")
+        doc = run(names, scale=args.scale, seed=args.seed)
+        _print_table(doc)
+        if args.out:
+            Path(args.out).write_text(json.dumps(doc, indent=2), "utf-8")
+        return
+
+    old = json.loads(Path(args.old).read_text("utf-8"))
+    new = json.loads(Path(args.new).read_text("utf-8"))
+    regressions = compare(old, new, threshold=args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    if regressions:
+        sys.exit(1)
+    print("no regressions")
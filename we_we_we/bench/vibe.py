@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+"""bench.vibe – fused :func:`analyze_text` vs. the original multi-pass scanner.
+
+CLI
+───
+$ python -m we_we_we.bench.vibe            # short, medium and 10 MB inputs
+$ python -m we_we_we.bench.vibe --repeat 5
+
+The legacy implementation below is a frozen copy of the pre-fusion
+``analyze_text`` (five regex passes, two ``Counter`` builds, one ``re.search``
+per keysmash candidate).  Every run also asserts both produce the same report.
+"""
+
+import argparse
+import random
+import re
+import time
+from collections import Counter
+from typing import Callable, Dict, List
+
+from ..vibe_sensor import PAPIAMENTU_SUGAR_WORDS, VibeReport, analyze_text
+
+_WORDS = (
+    "dushi ayó bon bini kon bo ta kla plase sinti jajajaja mmm we "
+    "the candy of void wifi listen keep screaming level noon lok "
+    "sksksksk asdfghjk qwzxcvbn glitch frog manifest soundtrack"
+).split()
+_SEPARATORS = [" ", " ", " ", ", ", "!!! ", "... ", "?? ", "\n"]
+
+_SIZES = {
+    "short": 80,
+    "medium": 4_000,
+    "10MB": 10 * 1024 * 1024,
+}
+
+
+# ------------------------------------------------------------------- corpus
+
+def make_text(size: int, *, seed: int = 47) -> str:
+    """Return roughly *size* characters of sugar/keysmash-heavy chatter."""
+
+    rng = random.Random(seed)
+    parts: List[str] = []
+    total = 0
+    while total < size:
+        part = rng.choice(_WORDS) + rng.choice(_SEPARATORS)
+        parts.append(part)
+        total += len(part)
+    return "".join(parts)[:size]
+
+
+# ------------------------------------------------------------------- legacy
+
+def legacy_analyze_text(text: str) -> VibeReport:
+    words = re.findall(r"[\w']+", text.lower())
+    repetition_rate = 0.0
+    if words:
+        counts = Counter(words)
+        repetition_rate = sum(c for c in counts.values() if c > 1) / len(words)
+    smashes = 0
+    for c in re.findall(r"[a-z]{3,}", text.lower(), re.IGNORECASE):
+        if len(c) >= 6 and c not in PAPIAMENTU_SUGAR_WORDS:
+            if re.search(r"sksk|asdf|dfgh|ghjk", c) or len(set(c)) > 4:
+                smashes += 1
+    counts = Counter(words)
+    return VibeReport(
+        length=len(text),
+        word_count=len(words),
+        repetition_rate=repetition_rate,
+        keysmash_hits=len(re.findall(r"(.)\1{2,}", text)) + smashes,
+        punct_overload=len(re.findall(r"([!?\.])\1{2,}", text)),
+        sugar_hits=sum(1 for w in words if w in PAPIAMENTU_SUGAR_WORDS),
+        palindrome_hits=sum(1 for w in words if len(w) > 2 and w == w[::-1]),
+        alert_tokens=[tok for tok, c in counts.items() if c >= 47],
+    )
+
+
+# ---------------------------------------------------------------- harness
+
+def _time(fn: Callable[[str], VibeReport], text: str, repeat: int) -> float:
+    """Return the best seconds-per-call over *repeat* rounds."""
+
+    calls = max(1, 200_000 // max(len(text), 1))
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn(text)
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
+
+
+def run(repeat: int = 3) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+    for label, size in _SIZES.items():
+        text = make_text(size)
+        if legacy_analyze_text(text).to_dict() != analyze_text(text).to_dict():
+            raise AssertionError(f"fused scanner disagrees with legacy on {label} input")
+        legacy = _time(legacy_analyze_text, text, repeat)
+        fused = _time(analyze_text, text, repeat)
+        results[label] = {
+            "chars": len(text),
+            "legacy_s": legacy,
+            "fused_s": fused,
+            "speedup": legacy / fused,
+        }
+    return results
+
+
+# ---------------------------------------------------------------------- CLI
+
+def _main() -> None:  # pragma: no cover
+    parser = argparse.ArgumentParser(description="Benchmark fused analyze_text against the legacy scanner.")
+    parser.add_argument("--repeat", type=int, default=3, help="timing rounds per input (best is kept)")
+    args = parser.parse_args()
+
+    print(f"{'input':>8} {'chars':>10} {'legacy':>12} {'fused':>12} {'speedup':>8}")
+    for label, row in run(args.repeat).items():
+        print(
+            f"{label:>8} {row['chars']:>10} {row['legacy_s'] * 1e6:>10.1f}us "
+            f"{row['fused_s'] * 1e6:>10.1f}us {row['speedup']:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    _main()
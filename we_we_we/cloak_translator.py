@@ -44,6 +44,11 @@ _CORP_TO_PLAYFUL: Dict[str, str] = {
     for k, v in _PLAYFUL_TO_CORP.items()
 }
 
+# corporate phrase -> playful form, for reveal()
+_PLAYFUL_TO_CORP_LITERAL: Dict[str, str] = {
+    v: k.strip("\\b") for k, v in _PLAYFUL_TO_CORP.items()
+}
+
 # ----------------------------------------------------------------- engines
 
 def _apply(text: str, mapping: Dict[str, str], *, flags=re.I) -> str:
@@ -59,12 +64,13 @@ def cloak(text: str) -> str:
 
 def reveal(text: str) -> str:
     """Attempt to convert corporate jargon back to playful form."""
-    # we match acronyms (e.g., QERE) first
+    # we match acronyms (e.g., QERE) first; playful forms are inserted literally
     for acro, playful in _CORP_TO_PLAYFUL.items():
-        text = re.sub(rf"\b{acro}\b", playful, text, flags=re.I)
-    # then long phrases
-    inverse = {v: k for k, v in _PLAYFUL_TO_CORP.items()}
-    return _apply(text, inverse)
+        text = re.sub(rf"\b{acro}\b", lambda _m, p=playful: p, text, flags=re.I)
+    # then long phrases (matched literally, they contain parentheses)
+    for corp, playful in _PLAYFUL_TO_CORP_LITERAL.items():
+        text = re.sub(re.escape(corp), lambda _m, p=playful: p, text, flags=re.I)
+    return text
 
 
 # ----------------------------------------------------------------------- CLI
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+"""dedup_filter – remember which texts were seen, in bounded memory.
+
+Used by :mod:`we_we_we.log_ingestor` to drop decoded payloads it already
+stored. Texts are keyed by a 128-bit BLAKE2b digest:
+
+* the first ``exact_max`` distinct texts go into an exact set of 64-bit keys
+  (about 60 bytes each in memory, 8 on disk);
+* later ones go into a *scalable* Bloom filter: a chain of filters, each
+  twice the capacity of the last with half its false-positive rate, so the
+  chain as a whole stays under ``error_rate`` however many texts arrive.
+
+A false positive drops a text that was new, with probability below
+``error_rate`` per text past the exact set; nothing is ever stored twice.
+
+Usage
+-----
+>>> seen = DedupFilter()
+>>> seen.add("dlrow olleh"), seen.add("dlrow olleh")
+(True, False)
+>>> seen.save(Path(".we_memory.json.ingest.seen"))
+"""
+
+import hashlib
+import math
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+__all__ = ["DedupFilter"]
+
+_MAGIC = b"WESEEN01"
+_HEADER = struct.Struct("<dQQI")  # error_rate, duplicates, exact keys, filters
+_FILTER = struct.Struct("<QQQI")  # capacity, count, bits, hashes
+_EXACT_MAX = 250_000  # ~15 MB of keys before switching to Bloom filters
+_ERROR_RATE = 1e-4  # bound on the chance a new text is taken for a seen one
+_GROWTH = 2  # capacity ratio between consecutive filters
+_TIGHTENING = 0.5  # error ratio between consecutive filters
+
+
+def _digest(text: str) -> Tuple[int, int]:
+    raw = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    return int.from_bytes(raw[:8], "little"), int.from_bytes(raw[8:], "little")
+
+
+class _Bloom:
+    """One fixed-capacity Bloom filter; indices by double hashing of a 128-bit digest."""
+
+    __slots__ = ("capacity", "count", "nbits", "hashes", "bits")
+
+    def __init__(self, capacity: int, error: float, *, nbits: int = 0, hashes: int = 0, count: int = 0, bits: Optional[bytearray] = None):
+        self.capacity = capacity
+        self.count = count
+        self.nbits = nbits or max(8, math.ceil(-capacity * math.log(error) / math.log(2) ** 2))
+        self.hashes = hashes or max(1, round(self.nbits / capacity * math.log(2)))
+        self.bits = bits if bits is not None else bytearray((self.nbits + 7) // 8)
+
+    def _indices(self, key: Tuple[int, int]) -> List[int]:
+        h1, h2 = key
+        h2 |= 1
+        return [(h1 + i * h2) % self.nbits for i in range(self.hashes)]
+
+    def __contains__(self, key: Tuple[int, int]) -> bool:
+        bits = self.bits
+        return all(bits[i >> 3] & (1 << (i & 7)) for i in self._indices(key))
+
+    def add(self, key: Tuple[int, int]) -> None:
+        bits = self.bits
+        for i in self._indices(key):
+            bits[i >> 3] |= 1 << (i & 7)
+        self.count += 1
+
+
+class DedupFilter:
+    """Set-like memory of texts: exact up to *exact_max*, a scalable Bloom filter beyond."""
+
+    def __init__(self, *, exact_max: int = _EXACT_MAX, error_rate: float = _ERROR_RATE):
+        self.exact_max = exact_max
+        self.error_rate = error_rate
+        self.duplicates = 0  # texts add() refused, over the filter's whole life
+        self.dirty = False  # changed since loaded or saved
+        self._exact: Set[int] = set()
+        self._filters: List[_Bloom] = []
+
+    def __len__(self) -> int:
+        return len(self._exact) + sum(f.count for f in self._filters)
+
+    def __contains__(self, text: str) -> bool:
+        return self._seen(_digest(text))
+
+    def _seen(self, key: Tuple[int, int]) -> bool:
+        return key[0] in self._exact or any(key in f for f in self._filters)
+
+    def add(self, text: str) -> bool:
+        """Remember *text*; False (and counted as a duplicate) if it was seen before."""
+
+        key = _digest(text)
+        if self._seen(key):
+            self.duplicates += 1
+            self.dirty = True
+            return False
+        if len(self._exact) < self.exact_max:
+            self._exact.add(key[0])
+        else:
+            if not self._filters or self._filters[-1].count >= self._filters[-1].capacity:
+                n = len(self._filters)
+                capacity = max(1, self.exact_max) * _GROWTH ** n
+                error = self.error_rate * (1 - _TIGHTENING) * _TIGHTENING ** n
+                self._filters.append(_Bloom(capacity, error))
+            self._filters[-1].add(key)
+        self.dirty = True
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        """Sizes and counters: exact, bloom, filters, bloom_bytes, duplicates."""
+
+        return {
+            "exact": len(self._exact),
+            "bloom": sum(f.count for f in self._filters),
+            "filters": len(self._filters),
+            "bloom_bytes": sum(len(f.bits) for f in self._filters),
+            "duplicates": self.duplicates,
+        }
+
+    # ------------------------------------------------------------ persistence
+    def save(self, path: Path) -> None:
+        """Write the filter to *path* atomically (temp file + rename)."""
+
+        keys = array("Q", self._exact)
+        if sys.byteorder == "big":  # pragma: no cover
+            keys.byteswap()
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with tmp.open("wb") as f:
+            f.write(_MAGIC)
+            f.write(_HEADER.pack(self.error_rate, self.duplicates, len(keys), len(self._filters)))
+            f.write(keys.tobytes())
+            for flt in self._filters:
+                f.write(_FILTER.pack(flt.capacity, flt.count, flt.nbits, flt.hashes))
+                f.write(flt.bits)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: Path, *, exact_max: int = _EXACT_MAX) -> "DedupFilter":
+        """Read a filter saved by :meth:`save`; an empty one if *path* does not exist."""
+
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return cls(exact_max=exact_max)
+        try:
+            if data[: len(_MAGIC)] != _MAGIC:
+                raise ValueError("bad magic")
+            pos = len(_MAGIC)
+            error_rate, duplicates, nkeys, nfilters = _HEADER.unpack_from(data, pos)
+            pos += _HEADER.size
+            keys = array("Q")
+            keys.frombytes(data[pos : pos + 8 * nkeys])
+            if len(keys) != nkeys:
+                raise ValueError("truncated key set")
+            if sys.byteorder == "big":  # pragma: no cover
+                keys.byteswap()
+            pos += 8 * nkeys
+            seen = cls(exact_max=exact_max, error_rate=error_rate)
+            seen.duplicates = duplicates
+            seen._exact = set(keys)
+            for _ in range(nfilters):
+                capacity, count, nbits, hashes = _FILTER.unpack_from(data, pos)
+                pos += _FILTER.size
+                nbytes = (nbits + 7) // 8
+                bits = bytearray(data[pos : pos + nbytes])
+                if len(bits) != nbytes:
+                    raise ValueError("truncated filter")
+                pos += nbytes
+                seen._filters.append(_Bloom(capacity, 0.5, nbits=nbits, hashes=hashes, count=count, bits=bits))
+        except (ValueError, struct.error) as exc:
+            raise ValueError(f"{path}: corrupt dedup state ({exc})") from exc
+        return seen
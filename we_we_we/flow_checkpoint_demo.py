@@ -15,7 +15,7 @@ import operator
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
 
-from .vibe_sensor import analyze_text
+from .vibe_sensor import analyze_text, enable_cache
 from .security_sigil import SecuritySigil
 from .mesh import _digest_latest
 
@@ -65,6 +65,9 @@ def main():
     if not args.text and not args.resume:
         p.error("--text or --resume required")
 
+    # vibe and sigil nodes analyse the same text; let the second one hit the cache
+    enable_cache(max_entries=256)
+
     if args.resume:
         thread_id = args.resume
         cfg = {"configurable": {"thread_id": thread_id}}
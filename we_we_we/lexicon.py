@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+"""lexicon – compiled vocabulary used by :mod:`we_we_we.vibe_sensor`.
+
+A lexicon bundles three word lists:
+
+* ``sugar_words``     – whole tokens counted as sugar hits
+* ``keysmash_ngrams`` – substrings that mark a long letter run as keysmash
+* ``alert_phrases``   – word sequences that always raise an alert token
+
+Files are JSON (or YAML when PyYAML is installed); missing keys fall back to
+the built-in lists::
+
+    {
+      "sugar_words": ["dushi", "ayó", "we"],
+      "keysmash_ngrams": ["sksk", "asdf"],
+      "alert_phrases": ["containment fiction", "lok lok lok"]
+    }
+
+Compilation turns sugar words into a frozenset, keysmash n-grams into one
+prefix-factored (trie-shaped) regex and alert phrases into a token trie, so
+matching cost does not grow with the number of entries. Swapping lexicons with
+:func:`set_lexicon` / :func:`watch_lexicon` is a single reference assignment:
+analyses already running keep the lexicon they started with.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Sequence, Set, Tuple
+
+__all__ = [
+    "Lexicon",
+    "PAPIAMENTU_SUGAR_WORDS",
+    "get_lexicon",
+    "load_lexicon",
+    "set_lexicon",
+    "watch_lexicon",
+]
+
+PAPIAMENTU_SUGAR_WORDS = {
+    "dushi",
+    "ayó",
+    "bon",
+    "bini",
+    "kon",
+    "bo",
+    "ta",
+    "kla",
+    "plase",
+    "sinti",
+    "jajajaja",
+    "mmm",
+    "mmmm",
+    "we",
+}
+KEYSMASH_NGRAMS = ("sksk", "asdf", "dfgh", "ghjk")
+
+_RE_WORD = re.compile(r"[\w']+")  # same tokenizer as vibe_sensor
+_RE_KEYSMASH = re.compile(r"[a-z]{3,}", re.IGNORECASE)
+_TRAITS_LIMIT = 1 << 16
+
+_PhraseNode = Dict[Any, Any]  # token -> child node; key None holds the phrase text
+
+
+class Lexicon:
+    """Immutable, compiled vocabulary. Build via :func:`load_lexicon` or directly."""
+
+    def __init__(
+        self,
+        sugar_words: Iterable[str] = PAPIAMENTU_SUGAR_WORDS,
+        keysmash_ngrams: Iterable[str] = KEYSMASH_NGRAMS,
+        alert_phrases: Iterable[str] = (),
+    ):
+        self.sugar_words: FrozenSet[str] = frozenset(w.lower() for w in sugar_words)
+        self.keysmash_ngrams: Tuple[str, ...] = tuple(sorted({n.lower() for n in keysmash_ngrams if n}))
+        phrases: List[str] = []
+        for phrase in alert_phrases:
+            canon = " ".join(_RE_WORD.findall(phrase.lower()))
+            if canon and canon not in phrases:
+                phrases.append(canon)
+        self.alert_phrases: Tuple[str, ...] = tuple(phrases)
+
+        self._ngram_re = re.compile(_trie_pattern(self.keysmash_ngrams))
+        self._phrase_root: _PhraseNode = {}
+        self.phrase_depth = 0  # longest alert phrase, in tokens
+        for phrase in self.alert_phrases:
+            node = self._phrase_root
+            toks = phrase.split(" ")
+            for tok in toks:
+                node = node.setdefault(tok, {})
+            node[None] = phrase
+            self.phrase_depth = max(self.phrase_depth, len(toks))
+
+        h = hashlib.sha256()
+        for part in (sorted(self.sugar_words), self.keysmash_ngrams, self.alert_phrases):
+            h.update(json.dumps(list(part), ensure_ascii=False).encode("utf-8"))
+        self.digest = h.hexdigest()[:16]
+
+        # token -> (keysmash, sugar, palindrome) hits
+        self._traits: Dict[str, Tuple[int, int, int]] = {}
+
+    def __reduce__(self):  # ship word lists, not compiled state, to worker processes
+        return (Lexicon, (self.sugar_words, self.keysmash_ngrams, self.alert_phrases))
+
+    def __repr__(self) -> str:
+        return (
+            f"Lexicon(sugar={len(self.sugar_words)}, ngrams={len(self.keysmash_ngrams)}, "
+            f"phrases={len(self.alert_phrases)}, digest={self.digest})"
+        )
+
+    # -------------------------------------------------------------- tokens
+    def token_traits(self, tok: str) -> Tuple[int, int, int]:
+        """Return ``(keysmash, sugar, palindrome)`` hit counts for one lower-cased token."""
+
+        t = self._traits.get(tok)
+        if t is None:
+            if len(self._traits) > _TRAITS_LIMIT:
+                self._traits.clear()
+            t = self._traits[tok] = (
+                len(self.keysmash(tok)),
+                int(tok in self.sugar_words),
+                int(len(tok) > 2 and tok == tok[::-1]),
+            )
+        return t
+
+    def keysmash(self, text: str) -> List[str]:
+        """Return the keysmash-looking letter runs in *text*."""
+
+        # sequence of random letters that are not common english tokens length >=6
+        filtered: List[str] = []
+        for c in _RE_KEYSMASH.findall(text.lower()):
+            if len(c) >= 6 and c not in self.sugar_words:
+                # typical keysmash n-grams, or simply many distinct letters
+                if self._ngram_re.search(c) or len(set(c)) > 4:
+                    filtered.append(c)
+        return filtered
+
+    # ------------------------------------------------------------- phrases
+    def match_phrases(
+        self, words: Sequence[str], active: Tuple[_PhraseNode, ...] = ()
+    ) -> Tuple[Set[str], Tuple[_PhraseNode, ...]]:
+        """Walk *words* through the phrase trie.
+
+        *active* holds partial matches carried over from preceding text; the
+        partial matches still open after the last word are returned alongside
+        the phrases found, so callers can continue across chunk boundaries.
+        """
+
+        found: Set[str] = set()
+        root = self._phrase_root
+        if not root:
+            return found, ()
+        states = list(active)
+        for w in words:
+            if not states and w not in root:
+                continue
+            nxt = []
+            for node in (*states, root):
+                child = node.get(w)
+                if child is not None:
+                    phrase = child.get(None)
+                    if phrase is not None:
+                        found.add(phrase)
+                    if len(child) > (phrase is not None):
+                        nxt.append(child)
+            states = nxt
+        return found, tuple(states)
+
+
+# ----------------------------------------------------------------- loading
+
+def load_lexicon(path: str | os.PathLike) -> Lexicon:
+    """Read a JSON/YAML lexicon file and compile it."""
+
+    p = Path(path)
+    raw = p.read_text("utf-8")
+    if p.suffix.lower() in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError as exc:  # pragma: no cover
+            raise RuntimeError("PyYAML is required to load YAML lexicons") from exc
+        data = yaml.safe_load(raw) or {}
+    else:
+        data = json.loads(raw)
+    if not isinstance(data, dict):
+        raise ValueError(f"{p}: lexicon must be a mapping")
+    return Lexicon(
+        sugar_words=data.get("sugar_words", PAPIAMENTU_SUGAR_WORDS),
+        keysmash_ngrams=data.get("keysmash_ngrams", KEYSMASH_NGRAMS),
+        alert_phrases=data.get("alert_phrases", ()),
+    )
+
+
+def get_lexicon() -> Lexicon:
+    return _ACTIVE
+
+
+def set_lexicon(lexicon: Lexicon | None) -> Lexicon:
+    """Atomically activate *lexicon* (``None`` restores the built-in one)."""
+
+    global _ACTIVE
+    _ACTIVE = lexicon if lexicon is not None else Lexicon()
+    return _ACTIVE
+
+
+def watch_lexicon(path: str | os.PathLike, *, interval: float = 2.0) -> threading.Thread:
+    """Load *path* now and hot-reload it whenever its mtime or size changes.
+
+    Reloads compile in a daemon thread and then swap the active lexicon in one
+    step; a file that fails to parse keeps the previous lexicon active.
+    """
+
+    p = Path(path)
+    set_lexicon(load_lexicon(p))
+    st = p.stat()
+    seen = (st.st_mtime_ns, st.st_size)
+
+    def _loop() -> None:
+        nonlocal seen
+        while True:
+            time.sleep(interval)
+            try:
+                st = p.stat()
+                sig = (st.st_mtime_ns, st.st_size)
+                if sig != seen:
+                    set_lexicon(load_lexicon(p))
+                    seen = sig
+            except (OSError, ValueError, RuntimeError):
+                continue
+
+    thread = threading.Thread(target=_loop, name=f"lexicon-watch:{p.name}", daemon=True)
+    thread.start()
+    return thread
+
+
+# ----------------------------------------------------------------- helpers
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Compile literal *words* into one prefix-factored alternation."""
+
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = True
+    if not trie:
+        return r"(?!)"  # never matches
+
+    def build(node: Dict[str, Any]) -> str:
+        optional = "" in node
+        alts = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        if optional:
+            return (body if len(alts) > 1 else "(?:" + body + ")") + "?"
+        return body
+
+    return build(trie)
+
+
+_ACTIVE = Lexicon()  # built-in vocabulary; replaced wholesale by set_lexicon()
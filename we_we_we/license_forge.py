@@ -9,34 +9,28 @@ The generated licence text asserts:
 
 Licence files are stored next to `.we_memory.json` as
 `we_license_<artefact_id>.txt` and include a SHA-256 hash of the artefact body
-for tamper detection.
+for tamper detection. Palaces store bodies under that same hash, so for them
+it is read from the record instead of recomputed.
 """
 
-import hashlib
 from pathlib import Path
 from typing import Optional
 
-from .memory_palace import MemoryPalace
+from .memory_palace import get_palace
 
 _LICENSE_TMPL = """WE-WE-WE HYBRID LICENCE v0.1\n\nArtefact ID: {id}\nSHA-256: {sha}\nTags: {tags}\n\nYou are free to:\n  • Share  — copy and redistribute this material in any medium or format\n  • Adapt  — remix, transform, and build upon the material\nUnder the following terms (adapted from CC-BY-SA-4.0):\n  • Attribution  — give credit to the WE-WE-WE lineage.\n  • ShareAlike  — distribute contributions under the same licence.\nDefensive Patent Clause:\n  If you (or any entity you control) initiate patent litigation alleging this\n  artefact or derivative works infringe your patents, your licence terminates\n  unless you grant a perpetual, royalty-free licence to everyone.\n\nThis licence text is inseparable from the artefact hash above.\n"""
 
 __all__ = ["forge_licence"]
 
 
-def _hash(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
-
-
 def forge_licence(artefact_id: str, *, out_dir: Path | None = None) -> Path:
     """Generate licence file for *artefact_id* stored in MemoryPalace."""
 
-    palace = MemoryPalace()
-    artefacts = {a.id: a for a in palace.all()}
-    if artefact_id not in artefacts:
+    art = get_palace().get(artefact_id)
+    if art is None:
         raise KeyError(f"Artefact {artefact_id} not found in palace")
 
-    art = artefacts[artefact_id]
-    digest = _hash(art.text)
+    digest = art.sha256
     out_dir = out_dir or Path(".")
     path = out_dir / f"we_license_{artefact_id}.txt"
     path.write_text(
@@ -5,22 +5,92 @@ from __future__ import annotations
 Usage
 -----
 python -m we_we_we.log_ingestor path/to/file1.log path/to/dir/*.txt
+python -m we_we_we.log_ingestor "logs/**/*.log" --follow      # tail, polling every second
 
 Detected decoded artefacts are stored in the :pyclass:`we_we_we.memory_palace.MemoryPalace`
 so other modules (or curious humans) can inspect the hidden payload later.
+
+Files are streamed in binary chunks and decoded incrementally, so memory use
+does not depend on file size. Lines are split exactly like ``str.splitlines``
+on the whole (``errors="ignore"``-decoded) file, and decoded lines are
+committed to the palace every few thousand.
+
+``ingest(patterns, workers=N)`` cuts files into shards at ``\n`` bytes (small
+files are grouped into one task) and runs the reversal heuristic in a process
+pool. Results come back in order and are written by the calling process, so
+the palace ends up with the same artefacts as a serial run.
+
+Progress is checkpointed next to the palace (``.we_memory.json.ingest``): per
+file its device, inode, size and mtime, the offset read up to, and a SHA-256
+of its first KiB. A rerun skips unchanged files, reads only bytes appended
+since, follows a file renamed by log rotation, and starts over on a file that
+was truncated or replaced. A last line without its ``\n`` is read only once
+the file has been idle for a minute; the checkpoint still stops before it, so
+if the line grows later it is read again in full. ``--follow`` (or
+:func:`follow`) keeps polling for new bytes.
 """
 
 import argparse
+import bz2
+import codecs
 import glob
+import gzip
+import hashlib
+import json
+import lzma
+import os
+import queue
 import re
 import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Iterable, List
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .dedup_filter import DedupFilter
+from .memory_palace import MemoryPalace, get_palace
+from .vibe_sensor import _ordered_map
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX: no guard against overlapping runs
+    fcntl = None  # type: ignore[assignment]
 
-from .memory_palace import MemoryPalace
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:  # pragma: no cover - older Pythons: .zst files are read as plain bytes
+    zstd = None  # type: ignore[assignment]
+
+__all__ = ["follow", "ingest"]
 
 _COMMON_WORDS = {"the", "and", "we", "you", "to", "of", "in", "is"}
 _LETTER_RE = re.compile(r"[a-zA-Z]")
+# a line passes _is_likely_reversed only if it holds two whole (whitespace-delimited)
+# words that read as common words once reversed; on "\n"-joined, lowercased lines
+# this finds every such line (and a few more) without touching the others
+_REVERSED_WORDS = "|".join(sorted(w[::-1] for w in _COMMON_WORDS))
+_CANDIDATE_RE = re.compile(rf"\s(?:{_REVERSED_WORDS})(?=\s)[^\n]*?[^\S\n](?:{_REVERSED_WORDS})(?!\S)")
+_CHUNK_BYTES = 1 << 20  # read size; bounds memory per file
+_COMMIT_EVERY = 5_000  # decoded lines buffered before each palace write
+_SHARD_BYTES = 8 * 1024 * 1024  # bytes per worker task; smaller files are grouped up to this
+_TASK_MAX_FILES = 256  # cap on files grouped into one task
+_HEAD_BYTES = 1024  # fingerprinted prefix: tells a rotated-in or rewritten file from the checkpointed one
+_SAVE_SECONDS = 2.0  # checkpoint write interval; a crash re-reads at most this much
+_POLL_SECONDS = 1.0  # --follow interval
+_SETTLE_SECONDS = 60.0  # idle time after which an unterminated last line counts as complete
+_QUEUE_BLOCKS = 4  # decompressed blocks buffered ahead of the scanner
+# compressed formats, recognised by magic bytes whatever the file is called
+_COMPRESSED: List[Tuple[bytes, Callable[..., BinaryIO]]] = [
+    (b"\x1f\x8b", gzip.open),
+    (b"BZh", bz2.open),
+    (b"\xfd7zXZ\x00", lzma.open),
+]
+if zstd is not None:  # pragma: no cover
+    _COMPRESSED.append((b"\x28\xb5\x2f\xfd", zstd.open))
+_MAGIC_BYTES = max(len(magic) for magic, _ in _COMPRESSED)
+# every character str.splitlines() breaks on; "\r" is special-cased (it may start "\r\n")
+_LINE_BREAKS = frozenset("\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029")
 
 
 def _is_likely_reversed(text: str) -> bool:
@@ -45,24 +115,539 @@ def _iter_files(patterns: Iterable[str]) -> Iterable[Path]:
                 yield p
 
 
-def ingest(patterns: List[str]) -> None:
-    palace = MemoryPalace()
-    for file in _iter_files(patterns):
-        for line in file.read_text("utf-8", errors="ignore").splitlines():
-            rev = line[::-1]
+# ------------------------------------------------------------------ reading
+
+def _sniff(f: BinaryIO) -> Optional[Callable[..., BinaryIO]]:
+    """Return the opener for *f*'s compression format, or None for a plain file."""
+
+    f.seek(0)
+    head = f.read(_MAGIC_BYTES)
+    for magic, opener in _COMPRESSED:
+        if head.startswith(magic):
+            return opener
+    return None
+
+
+def _iter_blocks(path: Path, start: int, end: Optional[int], chunk_bytes: int) -> Iterator[bytes]:
+    with path.open("rb") as f:
+        opener = _sniff(f)
+        if opener is not None:
+            f.close()
+            yield from _iter_decompressed(opener, path, chunk_bytes)
+            return
+        f.seek(start)
+        left = end - start if end is not None else None
+        while True:
+            block = f.read(chunk_bytes if left is None else min(chunk_bytes, left))
+            if not block:
+                return
+            if left is not None:
+                left -= len(block)
+            yield block
+
+
+def _iter_decompressed(opener: Callable[..., BinaryIO], path: Path, chunk_bytes: int) -> Iterator[bytes]:
+    """Yield decompressed blocks of *path*, inflated ahead of the caller by a reader thread.
+
+    zlib, bz2 and lzma release the GIL while they work, so decompression
+    overlaps the line splitting and heuristic done on the previous blocks.
+    A truncated or corrupt archive ends at the last block that decoded.
+    """
+
+    blocks: "queue.Queue[bytes]" = queue.Queue(maxsize=_QUEUE_BLOCKS)
+    done = threading.Event()
+
+    def pump() -> None:
+        try:
+            with opener(path, "rb") as f:
+                while not done.is_set():
+                    block = f.read(chunk_bytes)
+                    if not block:
+                        break
+                    blocks.put(block)
+        except (EOFError, OSError, lzma.LZMAError):
+            pass  # keep what decoded, as errors="ignore" does for plain files
+        finally:
+            blocks.put(b"")
+
+    reader = threading.Thread(target=pump, name=f"inflate {path.name}", daemon=True)
+    reader.start()
+    try:
+        while True:
+            block = blocks.get()
+            if not block:
+                break
+            yield block
+    finally:
+        done.set()
+        while reader.is_alive():  # unblock a pending put() if the caller stopped early
+            try:
+                blocks.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        reader.join()
+
+
+# a shard is (path, start, end): *start*/*end* are nominal byte offsets, each
+# moved forward to just past the next "\n" (end=None: read to EOF)
+_Shard = Tuple[str, int, Optional[int]]
+
+
+def _iter_line_batches(
+    path: Path,
+    stats: Dict[str, float],
+    *,
+    start: int = 0,
+    end: Optional[int] = None,
+    chunk_bytes: int = _CHUNK_BYTES,
+) -> Iterator[List[str]]:
+    """Yield the lines of *path*, a list per chunk, as ``read_text(errors="ignore").splitlines()`` would.
+
+    With *start* / *end* only bytes ``[start, end)`` are read; callers pass
+    offsets just past a ``\n``, where both line splitting and UTF-8 decoding
+    agree with reading the whole file. Compressed files are read whole and
+    decompressed (*start* / *end* must be left at their defaults).
+    """
+
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    partial: List[str] = []  # pieces of a line spanning chunks, joined once it ends
+    after_cr = False  # the previous chunk ended in "\r", so a leading "\n" belongs to it
+    for block in _iter_blocks(path, start, end, chunk_bytes):
+        stats["bytes"] += len(block)
+        text = decoder.decode(block)
+        if not text:
+            continue  # only part of a multi-byte character so far
+        if after_cr and text[0] == "\n":
+            text = text[1:]
+            if not text:
+                after_cr = False
+                continue
+        lines = text.splitlines()
+        last = text[-1]
+        after_cr = last == "\r"
+        tail = None if last in _LINE_BREAKS else lines.pop()
+        if lines:
+            if partial:
+                partial.append(lines[0])
+                lines[0] = "".join(partial)
+                partial = []
+            yield lines
+        if tail is not None:
+            partial.append(tail)
+    if partial:
+        yield ["".join(partial)]
+
+
+def _candidates(lines: List[str]) -> Iterator[int]:
+    """Indices of the *lines* that may pass :func:`_is_likely_reversed` (a superset).
+
+    One regex pass over the whole batch instead of a reversal, ``findall``
+    and word set per line; the lines it skips are exactly those the
+    heuristic would reject for want of two common words.
+    """
+
+    # lower(): _is_likely_reversed lowercases words; "\n" cannot occur inside a line
+    text = "\n" + "\n".join(lines).lower()
+    prev = 0
+    line = seen = -1
+    for m in _CANDIDATE_RE.finditer(text):
+        line += text.count("\n", prev, m.end())
+        prev = m.end()
+        if line != seen:
+            seen = line
+            yield line
+
+
+def _decode_lines(batches: Iterable[List[str]], stats: Dict[str, float]) -> Iterator[str]:
+    for lines in batches:
+        stats["lines"] += len(lines)
+        for i in _candidates(lines):
+            rev = lines[i][::-1]
             if _is_likely_reversed(rev):
-                palace.add(rev, "decoded", file.name)
+                stats["decoded"] += 1
+                yield rev
+
+
+def _line_start(f: BinaryIO, pos: int) -> int:
+    """Offset of the first line beginning at or after *pos* (just past a ``\n``, or EOF)."""
+
+    if pos <= 0:
+        return 0
+    f.seek(pos - 1)
+    while True:
+        block = f.read(64 * 1024)
+        if not block:
+            return f.tell()
+        i = block.find(b"\n")
+        if i >= 0:
+            return f.tell() - len(block) + i + 1
+
+
+def _line_end(f: BinaryIO, start: int, size: int) -> int:
+    """Offset just past the last ``\n`` in bytes ``[start, size)`` (*start* if there is none)."""
+
+    pos = size
+    while pos > start:
+        n = min(64 * 1024, pos - start)
+        f.seek(pos - n)
+        i = f.read(n).rfind(b"\n")
+        if i >= 0:
+            return pos - n + i + 1
+        pos -= n
+    return start
+
+
+def _fingerprint(f: BinaryIO, length: int) -> str:
+    f.seek(0)
+    return hashlib.sha256(f.read(length)).hexdigest()
+
+
+# --------------------------------------------------------------- checkpoints
+
+class _Checkpoints:
+    """Per-file ingest progress, persisted as JSON next to the palace.
+
+    Entries are keyed by absolute path: ``dev``, ``ino``, ``size`` and
+    ``mtime_ns`` as last stat'ed, ``offset`` read up to (always just past a
+    ``\n``), ``tail``, the bytes of an unterminated last line read past it,
+    and ``fp``, the SHA-256 of the first ``fp_len`` bytes. ``size`` is -1
+    until every byte planned for the file has been stored.
+
+    With *dedup* the payloads already stored are remembered in ``<path>.seen``
+    (a :class:`~we_we_we.dedup_filter.DedupFilter`), saved just before the
+    offsets so a line re-read after a crash is known as stored.
+    """
+
+    def __init__(self, path: Path, *, dedup: bool = True):
+        self.path = path
+        self.lock_path = path.with_name(path.name + ".lock")
+        self.seen_path = path.with_name(path.name + ".seen")
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.line_ends: Dict[str, int] = {}  # per planned file: offset just past its last "\n"
+        self.seen = DedupFilter.load(self.seen_path) if dedup else None
+        self._fd: Optional[int] = None
+        self._saved = 0.0
+        try:
+            self.files = json.loads(path.read_text("utf-8"))
+        except FileNotFoundError:
+            pass
+        except ValueError as exc:
+            raise ValueError(f"{path}: corrupt ingest checkpoint ({exc})") from exc
+        # by identity, for files renamed since (log rotation)
+        self.moved = {(e["dev"], e["ino"]): e for e in self.files.values()}
+
+    def lock(self) -> None:
+        """Refuse to run alongside another ingest into the same palace."""
+
+        if fcntl is None:  # pragma: no cover
+            return
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            raise RuntimeError(f"{self.path}: another ingest is running") from None
+        self._fd = fd
+
+    def unlock(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)  # releases the lock
+            self._fd = None
+
+    def plan(
+        self, key: str, st: os.stat_result, stats: Dict[str, float], *, settle: float
+    ) -> Optional[Tuple[int, int, bool]]:
+        """Return ``(start, end, compressed)`` of *key* still to read, or None if unchanged.
+
+        *end* is just past the last ``\n``, or the end of the file once it has
+        not been modified for *settle* seconds (its last line is then taken
+        as complete). Compressed files are always read whole: a changed
+        archive starts over.
+        """
+
+        settled = time.time_ns() - st.st_mtime_ns >= settle * 1e9
+        entry = self.files.get(key)
+        if entry is None or (entry["dev"], entry["ino"]) != (st.st_dev, st.st_ino):
+            entry = self.moved.get((st.st_dev, st.st_ino))
+        if entry is not None and (entry["size"], entry["mtime_ns"]) == (st.st_size, st.st_mtime_ns):
+            self.files[key] = entry
+            if entry["offset"] + entry.get("tail", 0) >= st.st_size or not settled:
+                stats["unchanged"] += 1
+                return None
+        with open(key, "rb") as f:
+            compressed = _sniff(f) is not None
+            start = 0
+            if entry is not None:
+                if (
+                    not compressed
+                    and entry["offset"] <= st.st_size
+                    and _fingerprint(f, entry["fp_len"]) == entry["fp"]
+                ):
+                    start = entry["offset"]
+                else:
+                    stats["restarted"] += 1  # truncated, rewritten archive, or a reused inode
+            line_end = st.st_size if compressed else _line_end(f, start, st.st_size)
+            end = st.st_size if settled else line_end
+            fp_len = min(end, _HEAD_BYTES)
+            fp = entry["fp"] if start and entry is not None and entry["fp_len"] == fp_len else _fingerprint(f, fp_len)
+        self.files[key] = {
+            "dev": st.st_dev,
+            "ino": st.st_ino,
+            "size": st.st_size if end == start else -1,  # nothing to read: settled already
+            "mtime_ns": st.st_mtime_ns,
+            "offset": start,
+            "tail": end - line_end,
+            "fp": fp,
+            "fp_len": fp_len,
+        }
+        self.line_ends[key] = line_end
+        return start, end, compressed
+
+    def advance(self, key: str, offset: int, done: Optional[os.stat_result]) -> None:
+        entry = self.files[key]
+        entry["offset"] = min(offset, self.line_ends[key])  # a line read unterminated is read again once it grows
+        if done is not None:
+            entry["size"] = done.st_size
+
+    def save(self, *, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._saved < _SAVE_SECONDS:
+            return
+        self._saved = now
+        if self.seen is not None and self.seen.dirty:
+            self.seen.save(self.seen_path)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(self.files, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+    def prune(self) -> None:
+        """Forget files that no longer exist (rotated away and deleted)."""
+
+        self.files = {k: e for k, e in self.files.items() if os.path.exists(k)}
+        self.moved = {(e["dev"], e["ino"]): e for e in self.files.values()}
+
+
+# --------------------------------------------------------------------- ingest
+
+def _iter_tasks(
+    files: Iterable[Path],
+    shard_size: int,
+    stats: Dict[str, float],
+    checkpoints: Optional[_Checkpoints],
+    plans: Dict[str, Tuple[int, os.stat_result, bool]],
+    settle: float,
+) -> Iterator[List[_Shard]]:
+    task: List[_Shard] = []
+    task_bytes = 0
+    for file in files:
+        path = os.path.abspath(file)
+        if path in plans:
+            continue  # matched by more than one pattern
+        st = os.stat(path)
+        stats["files"] += 1
+        if checkpoints is None:
+            with open(path, "rb") as f:
+                compressed = _sniff(f) is not None
+            start, stop, end = 0, st.st_size, None
+        else:
+            span = checkpoints.plan(path, st, stats, settle=settle)
+            if span is None or span[1] <= span[0]:
+                continue
+            start, stop, compressed = span
+            end = stop
+        plans[path] = (stop, st, compressed)
+        step = shard_size
+        if compressed:
+            step, end = stop + 1, None  # no random access into archives: one shard, read to the end
+        for lo in range(start, stop, step) if stop - start > step else [start]:
+            hi = lo + step if lo + step < stop else end
+            task.append((path, lo, hi))
+            task_bytes += (stop if hi is None else hi) - lo
+            if task_bytes >= shard_size or len(task) >= _TASK_MAX_FILES:
+                yield task
+                task, task_bytes = [], 0
+    if task:
+        yield task
+
+
+def _scan_task(task: List[_Shard]) -> List[Tuple[str, List[str], int, int, int]]:
+    """Run the heuristic over each shard; ``(path, decoded lines, lines, bytes, end offset)`` per shard."""
+
+    out = []
+    for path, start, end in task:
+        with open(path, "rb") as f:
+            start = _line_start(f, start)
+            if end is not None:
+                end = _line_start(f, end)
+        stats: Dict[str, float] = {"bytes": 0, "lines": 0, "decoded": 0}
+        if end is None or end > start:
+            decoded = list(_decode_lines(_iter_line_batches(Path(path), stats, start=start, end=end), stats))
+        else:
+            decoded = []  # the shard held no line start
+        stop = start + int(stats["bytes"]) if end is None else max(start, end)
+        out.append((path, decoded, int(stats["lines"]), int(stats["bytes"]), stop))
+    return out
+
+
+def _checkpoint_path(palace: MemoryPalace) -> Path:
+    return palace.path.with_name(palace.path.name + ".ingest")
+
+
+def _ingest_pass(
+    palace: MemoryPalace,
+    patterns: List[str],
+    checkpoints: Optional[_Checkpoints],
+    seen: Optional[DedupFilter],
+    pool: Optional[ProcessPoolExecutor],
+    workers: int,
+    shard_size: int,
+    settle: float,
+) -> Dict[str, float]:
+    stats: Dict[str, float] = {
+        "files": 0, "unchanged": 0, "restarted": 0, "bytes": 0, "lines": 0, "decoded": 0, "duplicates": 0,
+    }
+    start = time.perf_counter()
+    plans: Dict[str, Tuple[int, os.stat_result, bool]] = {}  # path -> (offset read up to, stat, compressed)
+    tasks = _iter_tasks(_iter_files(patterns), shard_size, stats, checkpoints, plans, settle)
+    results = _ordered_map(pool, _scan_task, tasks, 2 * workers) if pool else map(_scan_task, tasks)
+    for result in results:
+        for path, decoded, lines, nbytes, end in result:
+            stats["lines"] += lines
+            stats["bytes"] += nbytes
+            stats["decoded"] += len(decoded)
+            if seen is not None:
+                fresh = [text for text in decoded if seen.add(text)]
+                stats["duplicates"] += len(decoded) - len(fresh)
+                decoded = fresh
+            tag = Path(path).name
+            for i in range(0, len(decoded), _COMMIT_EVERY):
+                palace.add_many(decoded[i : i + _COMMIT_EVERY], "decoded", tag)
+            if checkpoints is not None:
+                stop, st, compressed = plans[path]
+                if compressed:
+                    end = stop  # *end* counted decompressed bytes
+                checkpoints.advance(path, end, st if end >= stop else None)
+                checkpoints.save()
+    stats["seconds"] = time.perf_counter() - start
+    stats["mb_per_s"] = stats["bytes"] / 1e6 / stats["seconds"] if stats["seconds"] else 0.0
+    return stats
+
+
+def follow(
+    patterns: List[str],
+    *,
+    workers: int = 1,
+    shard_size: int = _SHARD_BYTES,
+    checkpoint: bool = True,
+    dedup: bool = True,
+    interval: float = _POLL_SECONDS,
+    settle: float = _SETTLE_SECONDS,
+) -> Iterator[Dict[str, float]]:
+    """Ingest *patterns* every *interval* seconds, yielding each pass's report.
+
+    A generator: the first pass runs on the first ``next()``, and nothing
+    stops it but the caller. Checkpoints are saved whenever it is closed.
+    An unterminated last line is read once its file has not been modified
+    for *settle* seconds, and read again in full if the line grows later.
+    """
+
+    palace = get_palace()
+    checkpoints = _Checkpoints(_checkpoint_path(palace), dedup=dedup) if checkpoint else None
+    seen = checkpoints.seen if checkpoints is not None else DedupFilter() if dedup else None
+    if checkpoints is not None:
+        checkpoints.lock()
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        while True:
+            yield _ingest_pass(palace, patterns, checkpoints, seen, pool, workers, shard_size, settle)
+            if checkpoints is not None:
+                checkpoints.save(force=True)
+            time.sleep(interval)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        if checkpoints is not None:
+            checkpoints.prune()
+            checkpoints.save(force=True)
+            checkpoints.unlock()
+
+
+def ingest(
+    patterns: List[str],
+    *,
+    workers: int = 1,
+    shard_size: int = _SHARD_BYTES,
+    checkpoint: bool = True,
+    dedup: bool = True,
+    settle: float = _SETTLE_SECONDS,
+) -> Dict[str, float]:
+    """Decode reversed lines from files matching *patterns* into the palace.
+
+    With ``workers > 1`` files (and pieces of files larger than *shard_size*)
+    are scanned in a process pool; this process stays the only palace writer
+    and stores decoded lines in file order, exactly as a serial run would.
+    With *checkpoint* only bytes appended since the last run are read, and an
+    unterminated last line only once the file has been idle for *settle*
+    seconds (a line still being written waits for a later run); without it
+    every file is read in full, unterminated last line included.
+    With *dedup* a payload already stored (by this run, or by earlier ones
+    when checkpointing) is dropped instead of stored again.
+
+    Returns a report: files, unchanged, restarted, bytes, lines, decoded,
+    duplicates, seconds, mb_per_s.
+    """
+
+    passes = follow(
+        patterns, workers=workers, shard_size=shard_size, checkpoint=checkpoint, dedup=dedup, settle=settle
+    )
+    try:
+        return next(passes)
+    finally:
+        passes.close()
 
 
 # -------------------------------------------------------------------------- CLI
 
+def _report(stats: Dict[str, float]) -> str:
+    return (
+        f"Decoded {stats['decoded']} of {stats['lines']} lines from {stats['files']} files, "
+        f"{stats['duplicates']} of them duplicates ({stats['unchanged']} unchanged, {stats['restarted']} restarted; "
+        f"{stats['bytes'] / 1e6:.1f} MB in {stats['seconds']:.2f}s, {stats['mb_per_s']:.1f} MB/s); "
+        "stored in MemoryPalace."
+    )
+
+
 def _main() -> None:  # pragma: no cover
     parser = argparse.ArgumentParser(description="Decode reversed lines from log files.")
     parser.add_argument("paths", nargs="+", help="file/dir patterns (glob)")
+    parser.add_argument("-j", "--workers", type=int, default=1, help="scanner processes (default: 1)")
+    parser.add_argument("--follow", action="store_true", help="keep polling the files for appended lines")
+    parser.add_argument("--interval", type=float, default=_POLL_SECONDS, help="--follow poll interval in seconds")
+    parser.add_argument("--no-checkpoint", action="store_true", help="read every file in full, ignoring earlier runs")
+    parser.add_argument("--no-dedup", action="store_true", help="store repeated payloads again")
+    parser.add_argument(
+        "--settle", type=float, default=_SETTLE_SECONDS, help="idle seconds before an unterminated last line is read"
+    )
     args = parser.parse_args()
 
-    ingest(args.paths)
-    print("Decoded artefacts stored in MemoryPalace.")
+    options = dict(
+        workers=args.workers, checkpoint=not args.no_checkpoint, dedup=not args.no_dedup, settle=args.settle
+    )
+    if not args.follow:
+        print(_report(ingest(args.paths, **options)))
+        return
+    passes = follow(args.paths, interval=args.interval, **options)
+    try:
+        for stats in passes:
+            if stats["bytes"]:
+                print(_report(stats), flush=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        passes.close()
 
 
 if __name__ == "__main__":
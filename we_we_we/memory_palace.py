@@ -5,20 +5,93 @@ from __future__ import annotations
 Stores *artefacts* (arbitrary text blobs) alongside user-defined tags.
 Writes to a JSON file in the current working directory so anyone can peek
 inside and learn to *think the WE WE WE way*.
+
+Storage is pluggable (:class:`PalaceBackend`). The default
+:class:`JsonBackend` keeps three files:
+
+* ``.we_memory.json``         – compacted snapshot (a JSON list of artefacts)
+* ``.we_memory.json.journal`` – artefacts added since, one JSON record per line
+* ``.we_memory.json.blobs``   – texts of 128+ characters, deduplicated and
+  compressed (see :mod:`we_we_we.palace_blobs`); records refer to them by SHA-256
+
+Blob texts are read from the pack only when ``artefact.text`` is accessed, so
+a loaded palace holds no long bodies in memory.
+
+:meth:`MemoryPalace.add` appends and fsyncs a single journal line, so adding is
+O(1) I/O. Once the journal outgrows the snapshot, both are folded into a new
+snapshot that is written to a temp file and renamed over the old one. Palaces
+written by older versions (snapshot only) load unchanged.
+
+Several processes may share a palace. Appends and compactions hold an
+exclusive ``flock`` on ``.we_memory.json.lock``, and reloads hold a shared one.
+The fsync runs after the lock is released, so concurrent writers' flushes
+coalesce (group commit). A snapshot that fails to parse raises
+:class:`ValueError`; it is never treated as an empty palace.
+
+For palaces with millions of artefacts use :class:`SqliteBackend` (picked
+automatically for ``.db`` / ``.sqlite`` / ``.sqlite3`` paths): a WAL-mode
+database with a normalized tag table and a timestamp index, so ``search``,
+``get`` and ``latest`` are index lookups and ``all`` streams rows lazily::
+
+    palace = MemoryPalace(Path("palace.db"))          # or backend="sqlite"
+    palace.search("decoded", "app.log")
+    palace.latest()
+
+Retention is per tag (:meth:`MemoryPalace.retain`) and applied on commit at
+most once per ``evict_interval`` seconds, or on demand with
+:meth:`MemoryPalace.evict`::
+
+    palace.retain("lulled", ttl=7 * 86400, max_count=100_000, keep_latest=50)
+    palace.evict()            # {"lulled": {"evicted": 12, "ttl": 12, ...}}
+
+JSON palaces journal evictions as ``{"op": "del", "id": ...}`` records, so the
+live files are never rewritten in place; the next compaction drops the
+evicted artefacts (and their unshared blobs) from fresh files renamed over
+the old ones.
 """
 
+import hashlib
 import json
+import os
+import sqlite3
+import threading
 import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Dict, List, Sequence
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .palace_blobs import BlobStore
+from .palace_fts import TextIndex, fts5_match, parse_query, tokenize
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX: single-process use only
+    fcntl = None  # type: ignore[assignment]
 
 __all__ = [
     "Artefact",
+    "JsonBackend",
     "MemoryPalace",
+    "PalaceBackend",
+    "Retention",
+    "SqliteBackend",
+    "get_palace",
 ]
 
 _MEMORY_PATH = Path(".we_memory.json")
+_JOURNAL_SUFFIX = ".journal"
+_LOCK_SUFFIX = ".lock"
+_BLOBS_SUFFIX = ".blobs"
+_BLOB_MIN_CHARS = 128  # shorter texts stay inline: a 64-char digest would save nothing
+_COMPACT_MIN_BYTES = 1 << 20  # never compact a journal smaller than this
+_SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+_SQLITE_PAGE = 1000  # rows fetched per query while iterating
+_SQLITE_BUSY_TIMEOUT = 30.0  # seconds a writer waits for another process's transaction
+_ID_SEQ_BITS = 12  # ids per millisecond before borrowing from the next one
+_ID_PID_BITS = 22  # Linux pid_max ceiling
+_EVICT_INTERVAL = 60.0  # seconds between on-commit retention passes
 
 
 @dataclass
@@ -33,6 +106,18 @@ class Artefact:
     def to_dict(self) -> Dict[str, object]:
         return asdict(self)
 
+    @property
+    def sha256(self) -> str:
+        """Hex SHA-256 of the UTF-8 text; free for artefacts read from a blob pack."""
+
+        return hashlib.sha256(self.text.encode("utf-8", "surrogatepass")).hexdigest()
+
+    @property
+    def nbytes(self) -> int:
+        """UTF-8 size of the text, as counted by :attr:`Retention.max_bytes`."""
+
+        return len(self.text.encode("utf-8", "surrogatepass"))
+
     # ------------------------------------------------------------------- helpers
     @classmethod
     def from_dict(cls, data: Dict[str, object]) -> "Artefact":
@@ -44,50 +129,1047 @@ class Artefact:
         )
 
 
-class MemoryPalace:
-    """A tiny JSON-backed store for symbolic artefacts."""
+class _BlobArtefact(Artefact):
+    """Artefact whose text stays in a :class:`BlobStore` until it is read.
+
+    Assigning ``text`` detaches it from the pack. Pickles (and copies) as a
+    plain :class:`Artefact`.
+    """
+
+    __slots__ = ("_blobs", "_digest", "_size", "_text")
+
+    def __init__(
+        self,
+        id: str,
+        text: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        timestamp: float = 0.0,
+        *,
+        blobs: Optional[BlobStore] = None,
+        digest: str = "",
+        size: int = -1,
+    ):
+        self.id = id
+        self.tags = [] if tags is None else tags
+        self.timestamp = timestamp
+        self._blobs = blobs
+        self._digest = digest
+        self._size = size  # UTF-8 bytes; -1 until known (records written before sizes were)
+        if blobs is None:
+            self._text = text
+
+    @property  # type: ignore[override]
+    def text(self) -> str:
+        blobs = self._blobs
+        return self._text if blobs is None else blobs.get_text(self._digest)
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self._blobs = None
+        self._text = value
+
+    @property
+    def sha256(self) -> str:
+        return Artefact.sha256.fget(self) if self._blobs is None else self._digest
+
+    @property
+    def nbytes(self) -> int:
+        if self._blobs is None:
+            return Artefact.nbytes.fget(self)
+        if self._size < 0:
+            self._size = Artefact.nbytes.fget(self)
+        return self._size
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Artefact):
+            return NotImplemented
+        return (self.id, self.tags, self.timestamp, self.text) == (other.id, other.tags, other.timestamp, other.text)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Artefact(id={self.id!r}, text={self.text!r}, tags={self.tags!r}, timestamp={self.timestamp!r})"
+
+    def __reduce__(self):
+        return Artefact, (self.id, self.text, self.tags, self.timestamp)
+
+
+@dataclass(frozen=True)
+class Retention:
+    """Retention policy for one tag (see :meth:`MemoryPalace.retain`).
+
+    Oldest artefacts are evicted first: those older than *ttl* seconds, then
+    as many as needed to get under *max_count* and *max_bytes* (UTF-8 text).
+    The newest *keep_latest* are never evicted.
+    """
+
+    ttl: Optional[float] = None
+    max_count: Optional[int] = None
+    max_bytes: Optional[int] = None
+    keep_latest: int = 0
+
+
+class _IdGenerator:
+    """Monotonic artefact ids: ``ms << 34 | pid << 12 | seq``, as decimal strings.
+
+    Strictly increasing within a process (a burst of more than 4096 ids per
+    millisecond borrows from the next millisecond) and distinct across
+    concurrently running processes, which never share a pid.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._ms = 0
+        self._seq = 0
+
+    def __call__(self) -> str:
+        ms = time.time_ns() // 1_000_000
+        with self._lock:
+            if ms <= self._ms:
+                ms, seq = self._ms, self._seq + 1
+                if seq >> _ID_SEQ_BITS:
+                    ms, seq = ms + 1, 0
+            else:
+                seq = 0
+            self._ms, self._seq = ms, seq
+        pid = os.getpid() & ((1 << _ID_PID_BITS) - 1)
+        return str((ms << (_ID_PID_BITS + _ID_SEQ_BITS)) | (pid << _ID_SEQ_BITS) | seq)
+
+
+_next_id = _IdGenerator()
+
+
+# ------------------------------------------------------------------ backends
+
+class PalaceBackend(ABC):
+    """Storage interface behind :class:`MemoryPalace`.
+
+    Artefacts are kept in insertion order; storing an existing id replaces the
+    artefact in place. A subclass must implement every abstract method before
+    it can be instantiated.
+    """
+
+    path: Path
+
+    @abstractmethod
+    def put(self, artefacts: Sequence[Artefact]) -> None:
+        ...
+
+    @abstractmethod
+    def get(self, artefact_id: str) -> Optional[Artefact]:
+        ...
+
+    @abstractmethod
+    def search(self, tags: Sequence[str]) -> List[Artefact]:
+        """Artefacts carrying *all* of *tags*, in insertion order."""
+
+    @abstractmethod
+    def find(self, query: str, limit: Optional[int]) -> List[Artefact]:
+        """Full-text search, best BM25 match first (see :mod:`we_we_we.palace_fts`)."""
 
-    def __init__(self, path: Path | None = None):
-        self.path: Path = path or _MEMORY_PATH
+    @abstractmethod
+    def iter_all(self) -> Iterator[Artefact]:
+        """Iterate artefacts stored so far; later additions are not visited."""
+
+    @abstractmethod
+    def latest(self) -> Optional[Artefact]:
+        """Artefact with the highest timestamp (earliest inserted on ties)."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    @abstractmethod
+    def delete(self, artefact_ids: Sequence[str]) -> int:
+        """Remove artefacts by id; return how many were present."""
+
+    def tag_usage(self, tag: str) -> List[Tuple[str, float, int]]:
+        """``(id, timestamp, nbytes)`` for every artefact tagged *tag*, in insertion order."""
+
+        return [(a.id, a.timestamp, a.nbytes) for a in self.search([tag])]
+
+    def reload(self) -> None:
+        """Pick up changes made by other processes."""
+
+    def refresh(self) -> bool:
+        """Reload only if the store changed on disk; return whether it did."""
+
+        return False
+
+    def compact(self) -> None:
+        """Reclaim space / fold logs; a no-op where not applicable."""
+
+    def close(self) -> None:
+        pass
+
+
+class JsonBackend(PalaceBackend):
+    """JSON snapshot plus JSONL journal, fully held in memory.
+
+    Besides the artefacts, the backend keeps a tag -> ids inverted index and
+    the journal offset it has read up to, so :meth:`refresh` only parses
+    records appended since the last look. The full-text index is built on the
+    first :meth:`find` and kept current from then on.
+
+    With ``blobs=False`` texts are written inline, as older versions did;
+    records referring to blobs are still read either way.
+    """
+
+    def __init__(self, path: Path, *, blobs: bool = True):
+        self.path = path
+        self.journal_path: Path = path.with_name(path.name + _JOURNAL_SUFFIX)
+        self.lock_path: Path = path.with_name(path.name + _LOCK_SUFFIX)
+        self.blobs = BlobStore(path.with_name(path.name + _BLOBS_SUFFIX))
+        self._write_blobs = blobs
         self._store: Dict[str, Artefact] = {}
-        self._load()
+        self._postings: Dict[str, Dict[str, None]] = {}  # tag -> ids, insertion-ordered
+        self._postings_ordered = True  # False once a re-tagged artefact broke store order
+        self._dead = 0  # artefacts deleted since the snapshot was written or read
+        self._latest: Optional[Artefact] = None  # cached; None also means "recompute"
+        self._fts: Optional[TextIndex] = None  # built on first find()
+        self._snapshot_sig: Optional[Tuple[int, int, int]] = None  # snapshot (inode, size, mtime)
+        self._snapshot_bytes = 0
+        self._journal_ino: Optional[int] = None
+        self._journal_offset = 0  # bytes parsed, always just after a newline
+        self._journal_bytes = 0  # journal size as last seen
+        self._lock = threading.RLock()  # threads; the flock below covers processes
+        self._flock_depth = 0
+        self._flock_exclusive = False
+        self.reload()
+
+    def put(self, artefacts: Sequence[Artefact]) -> None:
+        with self._lock:
+            for artefact in self._append(artefacts):
+                self._apply(artefact)
+
+    def get(self, artefact_id: str) -> Optional[Artefact]:
+        return self._store.get(artefact_id)
+
+    def search(self, tags: Sequence[str]) -> List[Artefact]:
+        required = set(tags)
+        with self._lock:
+            store = self._store
+            if not required:
+                return list(store.values())
+            # intersect posting lists, smallest first
+            postings = sorted((self._postings.get(tag, {}) for tag in required), key=len)
+            smallest, rest = postings[0], postings[1:]
+            ids = [i for i in smallest if all(i in p for p in rest)]
+            if not self._postings_ordered:
+                order = {artefact_id: n for n, artefact_id in enumerate(store)}
+                ids.sort(key=order.__getitem__)
+            return [store[i] for i in ids]
+
+    def find(self, query: str, limit: Optional[int]) -> List[Artefact]:
+        with self._lock:
+            if self._fts is None:
+                fts = TextIndex()
+                for artefact in self._store.values():
+                    fts.add(artefact.id, artefact.text)
+                self._fts = fts
+            store = self._store
+            return [store[doc_id] for doc_id, _ in self._fts.search(query, limit)]
+
+    def iter_all(self) -> Iterator[Artefact]:
+        return iter(list(self._store.values()))
+
+    def latest(self) -> Optional[Artefact]:
+        latest = self._latest
+        if latest is None:
+            latest = self._latest = max(self._store.values(), key=lambda a: a.timestamp, default=None)
+        return latest
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def delete(self, artefact_ids: Sequence[str]) -> int:
+        with self._lock:
+            self.refresh()
+            ids = [i for i in dict.fromkeys(artefact_ids) if i in self._store]
+            if not ids:
+                return 0
+            data = "".join(json.dumps({"op": "del", "id": i}) + "\n" for i in ids).encode("utf-8")
+            self._write_journal(data, {})
+            for artefact_id in ids:
+                self._remove(artefact_id)
+            if self._dead > len(self._store):
+                self.compact()  # the snapshot is mostly evicted artefacts by now
+            return len(ids)
+
+    def tag_usage(self, tag: str) -> List[Tuple[str, float, int]]:
+        with self._lock:
+            store = self._store
+            return [(i, store[i].timestamp, store[i].nbytes) for i in self._postings.get(tag, ())]
+
+    def compact(self) -> None:
+        """Fold the journal into a fresh snapshot and empty the journal."""
+
+        with self._lock, self._flock(exclusive=True):
+            self.refresh()  # fold in records other processes appended
+            self._compact_locked()
+
+    def close(self) -> None:
+        self.blobs.close()
+
+    def reload(self) -> None:
+        with self._lock, self._flock(exclusive=False):
+            self._snapshot_sig = _stat_sig(self.path)  # before reading: later writes show up as changes
+            self.blobs.refresh()  # the pack may have been rewritten along with the snapshot
+            self._dead = 0
+            store: Dict[str, Artefact] = {}
+            postings: Dict[str, Dict[str, None]] = {}
+            ordered = True
+            self._snapshot_bytes = 0
+            if self._snapshot_sig is not None:
+                raw = self.path.read_text("utf-8")
+                self._snapshot_bytes = len(raw)
+                try:
+                    data = json.loads(raw)
+                except json.JSONDecodeError as exc:
+                    # never fall back to an empty palace: the next compaction would make it permanent
+                    raise ValueError(f"{self.path}: corrupt palace snapshot ({exc})") from exc
+                for item in data:
+                    artefact = self._artefact(item)
+                    if artefact is not None:
+                        ordered &= _index(store, postings, artefact)
+            # readers holding the old containers are unaffected by the swap
+            self._store, self._postings, self._latest = store, postings, None
+            self._fts = None  # rebuilt by the next find()
+            self._postings_ordered = ordered
+            self._journal_ino = None
+            self._journal_offset = self._journal_bytes = 0
+            self._read_journal()
+
+    def refresh(self) -> bool:
+        journal = _stat_sig(self.journal_path)
+        if (
+            _stat_sig(self.path) == self._snapshot_sig
+            and (journal[1] if journal else 0) == self._journal_bytes
+            and (journal is None or self._journal_ino in (None, journal[0]))
+        ):
+            return False  # fast path: nothing changed, no lock taken
+        with self._lock, self._flock(exclusive=False):
+            journal = _stat_sig(self.journal_path)
+            if (
+                _stat_sig(self.path) != self._snapshot_sig  # compacted elsewhere
+                or (journal is None and self._journal_offset)
+                or (journal is not None and self._journal_ino not in (None, journal[0]))
+                or (journal is not None and journal[1] < self._journal_offset)  # truncated
+            ):
+                self.reload()
+                return True
+            if journal is None or journal[1] == self._journal_bytes:
+                return False
+            return self._read_journal()
+
+    def _apply(self, artefact: Artefact) -> None:
+        latest = self._latest
+        if latest is not None:
+            if artefact.id == latest.id or (
+                artefact.timestamp == latest.timestamp and artefact.id in self._store
+            ):
+                self._latest = None  # in-place replacement: ordering unclear, recompute
+            elif artefact.timestamp > latest.timestamp:
+                self._latest = artefact
+        if not _index(self._store, self._postings, artefact):
+            self._postings_ordered = False
+        if self._fts is not None:
+            self._fts.add(artefact.id, artefact.text)
+
+    def _remove(self, artefact_id: str) -> None:
+        old = self._store.pop(artefact_id, None)
+        if old is None:
+            return
+        for tag in set(old.tags):
+            ids = self._postings.get(tag)
+            if ids is not None:
+                ids.pop(artefact_id, None)
+                if not ids:
+                    del self._postings[tag]
+        if self._latest is not None and self._latest.id == artefact_id:
+            self._latest = None
+        if self._fts is not None:
+            self._fts.remove(artefact_id)
+        self._dead += 1
+
+    def _read_journal(self) -> bool:
+        """Apply complete journal records past the remembered offset."""
+
+        try:
+            with self.journal_path.open("rb") as f:
+                self._journal_ino = os.fstat(f.fileno()).st_ino
+                f.seek(self._journal_offset)
+                data = f.read()
+        except FileNotFoundError:
+            return False
+        self._journal_bytes = self._journal_offset + len(data)
+        end = data.rfind(b"\n") + 1  # a trailing partial line is left for the next read
+        if not end:
+            return False
+        for line in data[:end].decode("utf-8", errors="replace").splitlines():
+            try:
+                item = json.loads(line)
+                if item.get("op") == "del":
+                    self._remove(str(item["id"]))
+                    continue
+                artefact = self._artefact(item)
+            except (ValueError, KeyError, TypeError, AttributeError):
+                continue  # blank or torn line
+            if artefact is not None:
+                self._apply(artefact)
+        self._journal_offset += end
+        return True
+
+    def _artefact(self, item: Dict[str, object]) -> Optional[Artefact]:
+        """Build an artefact from a stored record; None if its blob never made it to disk."""
+
+        digest = item.get("blob")
+        if digest is None:
+            return Artefact.from_dict(item)
+        key = self.blobs.key(str(digest))
+        if key is None:
+            return None  # writer crashed between the blob and the record reaching the disk
+        return _BlobArtefact(
+            str(item["id"]),
+            tags=list(item.get("tags", [])),
+            timestamp=float(item.get("timestamp", 0.0)),
+            blobs=self.blobs,
+            digest=key,
+            size=int(item.get("size", -1)),
+        )
+
+    def _record(self, artefact: Artefact) -> Dict[str, object]:
+        if isinstance(artefact, _BlobArtefact) and artefact._blobs is self.blobs:
+            return {
+                "id": artefact.id,
+                "blob": artefact._digest,
+                "size": artefact.nbytes,
+                "tags": artefact.tags,
+                "timestamp": artefact.timestamp,
+            }
+        return artefact.to_dict()
+
+    def _to_blobs(self, artefacts: Sequence[Artefact]) -> Tuple[List[Artefact], Dict[str, Union[bytes, str]]]:
+        """Swap long texts for blob references; return the artefacts and the pending bodies."""
+
+        long = [a for a in artefacts if len(a.text) >= _BLOB_MIN_CHARS]
+        if not long:
+            return list(artefacts), {}
+        entries, pending = self.blobs.prepare(a.text for a in long)
+        lazy = {
+            id(a): _BlobArtefact(a.id, tags=a.tags, timestamp=a.timestamp, blobs=self.blobs, digest=d, size=n)
+            for a, (d, n) in zip(long, entries)
+        }
+        return [lazy.get(id(a), a) for a in artefacts], pending
+
+    def _append(self, artefacts: Sequence[Artefact]) -> List[Artefact]:
+        """Journal *artefacts*; return them as they should be held in memory."""
+
+        pending: Dict[str, Union[bytes, str]] = {}
+        if self._write_blobs:
+            # hashing and compression happen before the lock is taken
+            artefacts, pending = self._to_blobs(artefacts)
+        data = "".join(json.dumps(self._record(a)) + "\n" for a in artefacts).encode("utf-8")
+        self._write_journal(data, pending)
+        return list(artefacts)
+
+    def _write_journal(self, data: bytes, pending: Dict[str, Union[bytes, str]]) -> None:
+        # compaction truncates the journal in place, so this handle stays valid
+        with self.journal_path.open("a+b") as f:
+            with self._flock(exclusive=True):
+                new_blobs = self.blobs.write(pending)
+                size = f.seek(0, os.SEEK_END)
+                if size:
+                    f.seek(size - 1)
+                    if f.read(1) != b"\n":
+                        data = b"\n" + data  # keep a torn record on its own (skipped) line
+                f.write(data)
+                f.flush()
+                end = f.tell()
+            # outside the lock: concurrent writers' fsyncs overlap instead of queueing
+            if new_blobs:
+                self.blobs.sync()  # bodies first; a record whose blob is lost gets skipped on load
+            os.fsync(f.fileno())
+            self._journal_ino = os.fstat(f.fileno()).st_ino
+        if end - len(data) == self._journal_bytes:
+            # nobody appended since our last read: skip re-parsing our own records
+            self._journal_offset = self._journal_bytes = end
+        if end > max(self._snapshot_bytes, _COMPACT_MIN_BYTES):
+            with self._flock(exclusive=True):
+                self.refresh()
+                # another writer may have compacted while we waited for the lock
+                if self._journal_bytes > max(self._snapshot_bytes, _COMPACT_MIN_BYTES):
+                    self._compact_locked()
+
+    def _compact_locked(self) -> None:
+        self._write_snapshot()
+        with self.journal_path.open("w", encoding="utf-8"):
+            pass  # truncate; replaying it over the new snapshot would be harmless anyway
+        self._journal_ino = _stat_sig(self.journal_path)[0]
+        self._journal_offset = self._journal_bytes = 0
+        self._dead = 0
+        # every record is folded into the snapshot now, so unreferenced bodies are garbage
+        blobs = self.blobs
+        self.blobs.compact(
+            {a._digest for a in self._store.values() if isinstance(a, _BlobArtefact) and a._blobs is blobs}
+        )
+
+    @contextmanager
+    def _flock(self, *, exclusive: bool) -> Iterator[None]:
+        """Hold the cross-process lock; nested use inside an exclusive hold is free."""
+
+        if self._flock_depth:
+            if exclusive and not self._flock_exclusive:
+                raise RuntimeError("cannot upgrade a shared palace lock")
+            self._flock_depth += 1
+            try:
+                yield
+            finally:
+                self._flock_depth -= 1
+            return
+        if fcntl is None:  # pragma: no cover
+            yield
+            return
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            self._flock_depth, self._flock_exclusive = 1, exclusive
+            yield
+        finally:
+            self._flock_depth = 0
+            os.close(fd)  # releases the lock
+
+    def _write_snapshot(self) -> None:
+        store = self._store
+        if self._write_blobs:
+            # move inline texts (older palaces, detached artefacts) into the pack
+            inline = [a for a in store.values() if not (isinstance(a, _BlobArtefact) and a._blobs is self.blobs)]
+            moved, pending = self._to_blobs(inline)
+            if self.blobs.write(pending):
+                self.blobs.sync()
+            if pending:
+                for artefact in moved:
+                    store[artefact.id] = artefact
+                self._latest = None
+        # one artefact per line: still easy to peek at, far smaller than indent=2
+        body = ",\n".join(json.dumps(self._record(a)) for a in store.values())
+        payload = f"[\n{body}\n]\n" if body else "[]\n"
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        self._snapshot_bytes = len(payload)
+        self._snapshot_sig = _stat_sig(self.path)
+
+
+def _index(store: Dict[str, Artefact], postings: Dict[str, Dict[str, None]], artefact: Artefact) -> bool:
+    """Store *artefact* and update *postings*; False if a posting list lost store order."""
+
+    ordered = True
+    new_tags = set(artefact.tags)
+    old = store.get(artefact.id)
+    if old is not None:
+        for tag in set(old.tags) - new_tags:
+            postings[tag].pop(artefact.id, None)
+        new_tags -= set(old.tags)
+        ordered = not new_tags  # an old artefact joining a posting list lands at its end
+    for tag in new_tags:
+        postings.setdefault(tag, {})[artefact.id] = None
+    store[artefact.id] = artefact
+    return ordered
+
+
+def _stat_sig(path: Path) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS artefact (
+    seq       INTEGER PRIMARY KEY,      -- insertion order
+    id        TEXT    NOT NULL UNIQUE,
+    text      TEXT    NOT NULL,
+    tags      TEXT    NOT NULL,         -- JSON list, keeps order and duplicates
+    timestamp REAL    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS artefact_timestamp ON artefact (timestamp);
+CREATE TABLE IF NOT EXISTS tag (
+    tag_id INTEGER PRIMARY KEY,
+    name   TEXT    NOT NULL UNIQUE,
+    uses   INTEGER NOT NULL DEFAULT 0   -- posting list length, to pick the rarest tag
+);
+CREATE TABLE IF NOT EXISTS artefact_tag (
+    tag_id INTEGER NOT NULL REFERENCES tag (tag_id),
+    seq    INTEGER NOT NULL REFERENCES artefact (seq),
+    PRIMARY KEY (tag_id, seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS artefact_tag_seq ON artefact_tag (seq);
+"""
+# contentless FTS5 over the tokenized text; the ascii tokenizer with ' and _ as
+# token chars splits the space-joined vibe_sensor tokens back exactly
+_SQLITE_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS artefact_fts USING fts5 (
+    body, content='', tokenize="ascii tokenchars '''_'"
+)
+"""
+_SQLITE_FTS_VERSION = 1  # PRAGMA user_version once artefact_fts is backfilled
+
+
+class SqliteBackend(PalaceBackend):
+    """WAL-mode SQLite store; nothing but the connection is held in memory.
+
+    :meth:`find` runs on an FTS5 table kept in the same transactions as the
+    artefacts. Databases created before it existed are backfilled on open.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            str(path), timeout=_SQLITE_BUSY_TIMEOUT, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")  # WAL: durable up to the last checkpoint-safe commit
+        self._conn.executescript(_SQLITE_SCHEMA)
+        self._has_fts = self._init_fts()
+
+    def put(self, artefacts: Sequence[Artefact]) -> None:
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                tag_ids: Dict[str, int] = {}
+                for a in artefacts:
+                    old = cur.execute("SELECT seq, text FROM artefact WHERE id = ?", (a.id,)).fetchone()
+                    if old is None:
+                        seq = cur.execute(
+                            "INSERT INTO artefact (id, text, tags, timestamp) VALUES (?, ?, ?, ?)",
+                            (a.id, a.text, json.dumps(a.tags), a.timestamp),
+                        ).lastrowid
+                    else:
+                        seq = old[0]
+                        cur.execute(
+                            "UPDATE artefact SET text = ?, tags = ?, timestamp = ? WHERE seq = ?",
+                            (a.text, json.dumps(a.tags), a.timestamp, seq),
+                        )
+                        self._unlink(cur, seq, old[1])
+                    if self._has_fts:
+                        cur.execute("INSERT INTO artefact_fts (rowid, body) VALUES (?, ?)", (seq, _fts_body(a.text)))
+                    for name in set(a.tags):
+                        tag_id = tag_ids.get(name)
+                        if tag_id is None:
+                            cur.execute("INSERT OR IGNORE INTO tag (name) VALUES (?)", (name,))
+                            (tag_id,) = cur.execute("SELECT tag_id FROM tag WHERE name = ?", (name,)).fetchone()
+                            tag_ids[name] = tag_id
+                        cur.execute("INSERT INTO artefact_tag (tag_id, seq) VALUES (?, ?)", (tag_id, seq))
+                        cur.execute("UPDATE tag SET uses = uses + 1 WHERE tag_id = ?", (tag_id,))
+                cur.execute("COMMIT")
+            except BaseException:
+                cur.execute("ROLLBACK")
+                raise
+
+    def get(self, artefact_id: str) -> Optional[Artefact]:
+        rows = self._query("SELECT id, text, tags, timestamp FROM artefact WHERE id = ?", (artefact_id,))
+        return rows[0] if rows else None
+
+    def search(self, tags: Sequence[str]) -> List[Artefact]:
+        names = sorted(set(tags))
+        if not names:
+            return list(self.iter_all())
+        with self._lock:
+            marks = ",".join("?" * len(names))
+            found = self._conn.execute(
+                f"SELECT tag_id FROM tag WHERE name IN ({marks}) AND uses > 0 ORDER BY uses", names
+            ).fetchall()
+        if len(found) < len(names):
+            return []  # some tag is not used by any artefact
+        # walk the rarest tag's postings; every other tag is a primary-key probe
+        rarest, *rest = [tag_id for (tag_id,) in found]
+        probes = "".join(
+            " AND EXISTS (SELECT 1 FROM artefact_tag x WHERE x.tag_id = ? AND x.seq = p.seq)" for _ in rest
+        )
+        return self._query(
+            "SELECT a.id, a.text, a.tags, a.timestamp FROM artefact_tag p JOIN artefact a ON a.seq = p.seq "
+            f"WHERE p.tag_id = ?{probes} ORDER BY p.seq",
+            [rarest, *rest],
+        )
+
+    def find(self, query: str, limit: Optional[int]) -> List[Artefact]:
+        if not self._has_fts:
+            raise RuntimeError("this SQLite build lacks FTS5; MemoryPalace.find() is unavailable")
+        clauses = parse_query(query)
+        if not clauses:
+            return []
+        return self._query(
+            # rank and cut inside FTS5 first; only the survivors are joined to their rows
+            "SELECT a.id, a.text, a.tags, a.timestamp FROM ("
+            "SELECT rowid, rank FROM artefact_fts WHERE artefact_fts MATCH ? ORDER BY rank, rowid LIMIT ?"
+            ") f JOIN artefact a ON a.seq = f.rowid ORDER BY f.rank, a.seq",
+            (fts5_match(clauses), -1 if limit is None else limit),
+        )
+
+    def iter_all(self) -> Iterator[Artefact]:
+        with self._lock:
+            (stop,) = self._conn.execute("SELECT coalesce(max(seq), 0) FROM artefact").fetchone()
+        # keyset pagination: no cursor stays open between pages, so adds while iterating are safe
+        last = 0
+        while last < stop:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT seq, id, text, tags, timestamp FROM artefact "
+                    "WHERE seq > ? AND seq <= ? ORDER BY seq LIMIT ?",
+                    (last, stop, _SQLITE_PAGE),
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield _row_artefact(row[1:])
+            last = rows[-1][0]
+
+    def latest(self) -> Optional[Artefact]:
+        rows = self._query(
+            "SELECT id, text, tags, timestamp FROM artefact "
+            "WHERE timestamp = (SELECT max(timestamp) FROM artefact) ORDER BY seq LIMIT 1",
+            (),
+        )
+        return rows[0] if rows else None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT count(*) FROM artefact").fetchone()[0]
+
+    def delete(self, artefact_ids: Sequence[str]) -> int:
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                removed = 0
+                for artefact_id in dict.fromkeys(artefact_ids):
+                    row = cur.execute("SELECT seq, text FROM artefact WHERE id = ?", (artefact_id,)).fetchone()
+                    if row is None:
+                        continue
+                    self._unlink(cur, *row)
+                    cur.execute("DELETE FROM artefact WHERE seq = ?", (row[0],))
+                    removed += 1
+                cur.execute("COMMIT")
+            except BaseException:
+                cur.execute("ROLLBACK")
+                raise
+            return removed
+
+    def tag_usage(self, tag: str) -> List[Tuple[str, float, int]]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT a.id, a.timestamp, length(CAST(a.text AS BLOB)) FROM tag t "
+                "JOIN artefact_tag p ON p.tag_id = t.tag_id JOIN artefact a ON a.seq = p.seq "
+                "WHERE t.name = ? ORDER BY p.seq",
+                (tag,),
+            ).fetchall()
+
+    def compact(self) -> None:
+        with self._lock:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _unlink(self, cur: sqlite3.Cursor, seq: int, text: str) -> None:
+        """Drop the tag postings and FTS entry of row *seq* (inside a transaction)."""
+
+        cur.execute(
+            "UPDATE tag SET uses = uses - 1 WHERE tag_id IN (SELECT tag_id FROM artefact_tag WHERE seq = ?)",
+            (seq,),
+        )
+        cur.execute("DELETE FROM artefact_tag WHERE seq = ?", (seq,))
+        if self._has_fts:
+            cur.execute(
+                "INSERT INTO artefact_fts (artefact_fts, rowid, body) VALUES ('delete', ?, ?)",
+                (seq, _fts_body(text)),
+            )
+
+    def _query(self, sql: str, params: Sequence[object]) -> List[Artefact]:
+        with self._lock:
+            return [_row_artefact(row) for row in self._conn.execute(sql, params)]
+
+    def _init_fts(self) -> bool:
+        try:
+            self._conn.executescript(_SQLITE_FTS_SCHEMA)
+        except sqlite3.OperationalError:  # compiled without FTS5
+            return False
+        (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+        if version < _SQLITE_FTS_VERSION:
+            cur = self._conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                cur.execute("INSERT INTO artefact_fts (artefact_fts) VALUES ('delete-all')")
+                last = 0
+                while True:
+                    rows = cur.execute(
+                        "SELECT seq, text FROM artefact WHERE seq > ? ORDER BY seq LIMIT ?", (last, _SQLITE_PAGE)
+                    ).fetchall()
+                    if not rows:
+                        break
+                    cur.executemany(
+                        "INSERT INTO artefact_fts (rowid, body) VALUES (?, ?)",
+                        [(seq, _fts_body(text)) for seq, text in rows],
+                    )
+                    last = rows[-1][0]
+                cur.execute(f"PRAGMA user_version = {_SQLITE_FTS_VERSION}")
+                cur.execute("COMMIT")
+            except BaseException:
+                cur.execute("ROLLBACK")
+                raise
+        return True
+
+
+def _fts_body(text: str) -> str:
+    return " ".join(tokenize(text))
+
+
+def _row_artefact(row: Sequence[object]) -> Artefact:
+    artefact_id, text, tags, timestamp = row
+    return Artefact(id=artefact_id, text=text, tags=json.loads(tags), timestamp=timestamp)
+
+
+def _open_backend(path: Path, backend: str | None) -> PalaceBackend:
+    kind = backend or ("sqlite" if path.suffix.lower() in _SQLITE_SUFFIXES else "json")
+    if kind == "json":
+        return JsonBackend(path)
+    if kind == "sqlite":
+        return SqliteBackend(path)
+    raise ValueError(f"unknown palace backend {backend!r} (use 'json' or 'sqlite')")
+
+
+# -------------------------------------------------------------------- palace
+
+class MemoryPalace:
+    """A tiny JSON-backed store for symbolic artefacts.
+
+    *backend* is ``"json"``, ``"sqlite"`` or a ready :class:`PalaceBackend`;
+    by default it is chosen from the file suffix.
+    """
+
+    def __init__(self, path: Path | None = None, *, backend: str | PalaceBackend | None = None):
+        if isinstance(backend, PalaceBackend):
+            self.backend = backend
+        else:
+            self.backend = _open_backend(path or _MEMORY_PATH, backend)
+        self.path: Path = self.backend.path
+        self._pending = threading.local()  # per-thread batch buffer
+        self.retention: Dict[str, Retention] = {}
+        self.evict_interval = _EVICT_INTERVAL
+        self._next_evict = 0.0  # time.monotonic() deadline for the next on-commit pass
+        self._evict_lock = threading.Lock()
+        self._eviction_stats: Dict[str, Dict[str, int]] = {}
 
     # -------------------------------------------------------------- public API
     def add(self, text: str, *tags: str) -> Artefact:
         """Add *text* to the palace and return the created :class:`Artefact`."""
 
-        artefact_id = str(int(time.time() * 1000))
         artefact = Artefact(
-            id=artefact_id,
+            id=_next_id(),
             text=text,
             tags=list(tags),
             timestamp=time.time(),
         )
-        self._store[artefact_id] = artefact
-        self._save()
+        self._write([artefact])
         return artefact
 
+    def add_many(self, texts: Iterable[str], *tags: str) -> List[Artefact]:
+        """Add every text in *texts* with the same *tags*, committed in one write."""
+
+        now = time.time()
+        artefacts = [Artefact(id=_next_id(), text=t, tags=list(tags), timestamp=now) for t in texts]
+        self._write(artefacts)
+        return artefacts
+
+    @contextmanager
+    def batch(self) -> Iterator["MemoryPalace"]:
+        """Buffer :meth:`add` / :meth:`add_many` calls and commit them in one write.
+
+        Buffered artefacts are not visible to reads until the block exits; an
+        exception discards them. Nested batches join the outermost one, and
+        each thread has its own buffer.
+        """
+
+        pending: Optional[List[Artefact]] = getattr(self._pending, "artefacts", None)
+        if pending is not None:
+            yield self
+            return
+        self._pending.artefacts = pending = []
+        try:
+            yield self
+        finally:
+            self._pending.artefacts = None
+        if pending:
+            self._commit(pending)
+
     def search(self, *tags: str) -> List[Artefact]:
         """Return all artefacts that contain *all* specified *tags*."""
 
-        required = set(tags)
-        return [a for a in self._store.values() if required.issubset(a.tags)]
+        return self.backend.search(tags)
+
+    def all(self) -> Iterator[Artefact]:
+        """Lazily iterate every artefact in insertion order."""
+
+        return self.backend.iter_all()
+
+    def get(self, artefact_id: str) -> Optional[Artefact]:
+        return self.backend.get(artefact_id)
+
+    def find(self, query: str, *, limit: Optional[int] = 20) -> List[Artefact]:
+        """Full-text search over artefact text, best BM25 match first.
+
+        *query* holds clauses that must all match: ``word``, ``pre*`` and
+        ``"a phrase"`` (see :mod:`we_we_we.palace_fts`). ``limit=None``
+        returns every match.
+        """
+
+        return self.backend.find(query, limit)
+
+    def latest(self) -> Optional[Artefact]:
+        """Most recent artefact by timestamp, or ``None`` for an empty palace."""
+
+        return self.backend.latest()
+
+    def __len__(self) -> int:
+        return len(self.backend)
+
+    def refresh(self) -> bool:
+        """Reload if another process changed the store; cheap (a few stats) otherwise."""
+
+        return self.backend.refresh()
+
+    def compact(self) -> None:
+        self.backend.compact()
 
-    def all(self) -> Sequence[Artefact]:
-        return list(self._store.values())
+    def close(self) -> None:
+        self.backend.close()
+
+    # --------------------------------------------------------------- retention
+    def retain(
+        self,
+        tag: str,
+        *,
+        ttl: Optional[float] = None,
+        max_count: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        keep_latest: int = 0,
+    ) -> Retention:
+        """Set (or replace) the retention policy for *tag*; it applies from the next commit."""
+
+        policy = Retention(ttl=ttl, max_count=max_count, max_bytes=max_bytes, keep_latest=keep_latest)
+        self.retention[tag] = policy
+        self._next_evict = 0.0
+        return policy
+
+    def evict(self, *, now: Optional[float] = None) -> Dict[str, Dict[str, int]]:
+        """Apply every retention policy now and return this pass's per-tag stats.
+
+        Each tag reports ``evicted`` / ``evicted_bytes``, the policy that
+        triggered them (``ttl``, ``count``, ``bytes``) and what is left
+        (``kept`` / ``kept_bytes``).
+        """
+
+        now = time.time() if now is None else now
+        result: Dict[str, Dict[str, int]] = {}
+        with self._evict_lock:
+            for tag, policy in list(self.retention.items()):
+                victims, stats = _plan_eviction(self.backend.tag_usage(tag), policy, now)
+                stats["evicted"] = self.backend.delete(victims) if victims else 0
+                result[tag] = stats
+                total = self._eviction_stats.setdefault(tag, {"runs": 0})
+                total["runs"] += 1
+                for key, value in stats.items():
+                    if key.startswith("kept"):
+                        total[key] = value
+                    else:
+                        total[key] = total.get(key, 0) + value
+        return result
+
+    def eviction_stats(self) -> Dict[str, Dict[str, int]]:
+        """Cumulative per-tag eviction counters of this palace object, plus the latest sizes."""
+
+        with self._evict_lock:
+            return {tag: dict(stats) for tag, stats in self._eviction_stats.items()}
 
     # ----------------------------------------------------------- internal I/O
+    def _write(self, artefacts: List[Artefact]) -> None:
+        pending = getattr(self._pending, "artefacts", None)
+        if pending is not None:
+            pending.extend(artefacts)
+        elif artefacts:
+            self._commit(artefacts)
+
+    def _commit(self, artefacts: List[Artefact]) -> None:
+        self.backend.put(artefacts)
+        if self.retention and time.monotonic() >= self._next_evict:
+            self._next_evict = time.monotonic() + self.evict_interval
+            self.evict()
+
     def _load(self) -> None:
-        if not self.path.exists():
-            return
-        try:
-            data = json.loads(self.path.read_text("utf-8"))
-        except json.JSONDecodeError:
-            return
-        for raw in data:
-            artefact = Artefact.from_dict(raw)
-            self._store[artefact.id] = artefact
+        self.backend.reload()
+
+
+def _plan_eviction(
+    usage: List[Tuple[str, float, int]], policy: Retention, now: float
+) -> Tuple[List[str], Dict[str, int]]:
+    """Pick the ids *policy* evicts from one tag's ``(id, timestamp, nbytes)`` rows."""
+
+    rows = sorted(usage, key=lambda row: row[1])  # oldest first; stable, so ties keep insertion order
+    count = len(rows)
+    size = sum(row[2] for row in rows)
+    cutoff = None if policy.ttl is None else now - policy.ttl
+    stats = {"ttl": 0, "count": 0, "bytes": 0, "evicted_bytes": 0}
+    victims: List[str] = []
+    for artefact_id, timestamp, nbytes in rows[: max(0, count - policy.keep_latest)]:
+        if cutoff is not None and timestamp < cutoff:
+            reason = "ttl"
+        elif policy.max_count is not None and count > policy.max_count:
+            reason = "count"
+        elif policy.max_bytes is not None and size > policy.max_bytes:
+            reason = "bytes"
+        else:
+            break  # everything newer is within every limit too
+        victims.append(artefact_id)
+        stats[reason] += 1
+        stats["evicted_bytes"] += nbytes
+        count -= 1
+        size -= nbytes
+    stats["kept"] = count
+    stats["kept_bytes"] = size
+    return victims, stats
+
+
+# ------------------------------------------------------------------ registry
+
+_REGISTRY: Dict[Path, MemoryPalace] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_palace(path: Path | str | None = None, *, backend: str | None = None) -> MemoryPalace:
+    """Return the process-wide palace for *path* (default ``.we_memory.json``).
+
+    The first call per resolved path opens the store; later calls return the
+    same object after a :meth:`MemoryPalace.refresh`, so they only pay for a
+    reload when another process actually changed the files.
+    """
+
+    key = Path(path or _MEMORY_PATH).resolve()
+    with _REGISTRY_LOCK:
+        palace = _REGISTRY.get(key)
+        if palace is None:
+            palace = _REGISTRY[key] = MemoryPalace(key, backend=backend)
+            return palace
+    palace.refresh()
+    return palace
+
 
-    def _save(self) -> None:
-        payload = [a.to_dict() for a in self._store.values()]
-        self.path.write_text(json.dumps(payload, indent=2), "utf-8")
\ No newline at end of file
+if hasattr(os, "register_at_fork"):  # children must not share SQLite connections
+    os.register_at_fork(after_in_child=_REGISTRY.clear)
@@ -11,17 +11,16 @@ import time
 from typing import Dict
 
 from .quantum_bus import QuantumBus
-from .memory_palace import MemoryPalace
+from .memory_palace import get_palace
 
 _TICK_EMOJI = "🤝"
 _INTERVAL = 69  # seconds
 
 
 def _digest_latest() -> Dict[str, str]:
-    palace = MemoryPalace()
-    if not palace.all():
+    latest = get_palace().latest()
+    if latest is None:
         return {}
-    latest = max(palace.all(), key=lambda a: a.timestamp)
     h = hashlib.sha1(latest.text.encode()).hexdigest()[:8]
     return {"hash": h, "tags": latest.tags[:5]}
 
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+"""palace_blobs – content-addressed, compressed artefact bodies.
+
+Bodies live in one append-only pack file next to the palace
+(``.we_memory.json.blobs``), keyed by the SHA-256 of their UTF-8 text, so a
+text stored a thousand times takes the disk space of one. Each record is::
+
+    sha256 (32 bytes) | codec (1 byte) | length (uint32 LE) | payload
+
+where *codec* is ``0`` raw, ``1`` zlib or ``2`` lzma (used for bodies of
+64 KiB and up); a body is kept raw unless compression makes it smaller.
+Reads slice an ``mmap`` of the pack, so fetching a body is a dict probe plus a
+decompress and the pack is never read into memory as a whole.
+
+Records are appended (a torn tail left by a crashed writer is cut off
+first). Bodies no artefact refers to any more are dropped by
+:meth:`BlobStore.compact`, which writes a new pack and renames it over the old
+one. :class:`BlobStore` does no cross-process locking of its own:
+writers must hold the palace's exclusive lock (see
+:class:`we_we_we.memory_palace.JsonBackend`).
+"""
+
+import hashlib
+import lzma
+import mmap
+import os
+import struct
+import sys
+import threading
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+__all__ = ["BlobStore", "digest_text"]
+
+_MAGIC = b"WEBLOBS1"
+_HEADER = struct.Struct("<32sBI")
+_RAW, _ZLIB, _LZMA = 0, 1, 2
+_COMPRESS_MIN = 64  # shorter bodies never shrink enough to pay for the codec
+_LZMA_MIN = 64 * 1024  # lzma is ~10x slower than zlib; only worth it for big bodies
+_REWRITE_MIN_BYTES = 1 << 20  # never rewrite a pack to reclaim less than this
+
+
+def _encode(text: str) -> bytes:
+    return text.encode("utf-8", "surrogatepass")  # same round trip json.dumps gives
+
+
+def digest_text(text: str) -> str:
+    """Hex SHA-256 of *text* as the pack keys it."""
+
+    return hashlib.sha256(_encode(text)).hexdigest()
+
+
+def _pack(raw: bytes) -> Tuple[int, bytes]:
+    if len(raw) < _COMPRESS_MIN:
+        return _RAW, raw
+    if len(raw) >= _LZMA_MIN:
+        codec, data = _LZMA, lzma.compress(raw)
+    else:
+        codec, data = _ZLIB, zlib.compress(raw, 6)
+    return (codec, data) if len(data) < len(raw) else (_RAW, raw)
+
+
+class BlobStore:
+    """Append-only pack of SHA-256-keyed, compressed text bodies."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        # (mmap, digest -> header offset, inode); replaced as a whole when the pack is rewritten
+        self._state: Tuple[Optional[mmap.mmap], Dict[str, int], Optional[int]] = (None, {}, None)
+        self._retired: Optional[Tuple[Optional[mmap.mmap], Dict[str, int], Optional[int]]] = None
+        self._scanned = 0  # end of the last complete record indexed
+        self._lock = threading.Lock()  # serializes scans; reads need none
+        self.refresh()
+
+    def __contains__(self, digest: str) -> bool:
+        return digest in self._state[1]
+
+    def __len__(self) -> int:
+        return len(self._state[1])
+
+    def key(self, digest: str) -> Optional[str]:
+        """Return the shared key object for *digest*, scanning new records if needed."""
+
+        if digest not in self._state[1]:
+            self.refresh()
+        return sys.intern(digest) if digest in self._state[1] else None
+
+    def get_text(self, digest: str) -> str:
+        mm, offsets, _ = self._state
+        offset = offsets.get(digest)
+        if offset is None:
+            self.refresh()
+            mm, offsets, _ = self._state
+            offset = offsets.get(digest)
+            if offset is None and self._retired is not None:
+                # dropped by a rewrite while an evicted artefact was still held
+                mm, offsets, _ = self._retired
+                offset = offsets.get(digest)
+            if offset is None:
+                raise KeyError(digest)
+        _, codec, length = _HEADER.unpack_from(mm, offset)
+        start = offset + _HEADER.size
+        data = mm[start : start + length]
+        if codec == _ZLIB:
+            data = zlib.decompress(data)
+        elif codec == _LZMA:
+            data = lzma.decompress(data)
+        return data.decode("utf-8", "surrogatepass")
+
+    # ------------------------------------------------------------ writes
+    def prepare(self, texts: Iterable[str]) -> Tuple[List[Tuple[str, int]], Dict[str, Union[bytes, str]]]:
+        """Hash and compress *texts*; return ``(digest, size)`` per text and the pending bodies.
+
+        Needs no lock, so the CPU work stays outside the writers' critical
+        section. Bodies already in the pack are not compressed; their text is
+        kept in case a rewrite drops them before :meth:`write`.
+        """
+
+        entries: List[Tuple[str, int]] = []
+        pending: Dict[str, Union[bytes, str]] = {}
+        offsets = self._state[1]
+        for text in texts:
+            raw = _encode(text)
+            digest = sys.intern(hashlib.sha256(raw).hexdigest())  # one key object per body
+            if digest not in pending:
+                pending[digest] = text if digest in offsets else _record(digest, raw)
+            entries.append((digest, len(raw)))
+        return entries, pending
+
+    def write(self, pending: Dict[str, Union[bytes, str]]) -> bool:
+        """Append *pending* bodies not yet in the pack (writer lock held); True if any were."""
+
+        if not pending:
+            return False
+        self.refresh()  # another process may have stored (or dropped) some of them meanwhile
+        offsets = self._state[1]
+        chunks = [
+            _record(digest, _encode(body)) if isinstance(body, str) else body
+            for digest, body in pending.items()
+            if digest not in offsets
+        ]
+        if not chunks:
+            return False
+        self._append(b"".join(chunks))
+        return True
+
+    def compact(self, live: Set[str]) -> int:
+        """Rewrite the pack without bodies outside *live* once they outweigh the rest.
+
+        Writer lock held. The new pack replaces the old one by rename, so
+        readers keep their mapping of the old file. Returns bytes reclaimed.
+        """
+
+        self.refresh()
+        mm, offsets, _ = self._state
+        if mm is None:
+            return 0
+        keep: List[Tuple[int, int]] = []
+        live_bytes = 0
+        for digest, offset in offsets.items():
+            if digest in live:
+                end = offset + _HEADER.size + _HEADER.unpack_from(mm, offset)[2]
+                keep.append((offset, end))
+                live_bytes += end - offset
+        dead_bytes = self._scanned - len(_MAGIC) - live_bytes
+        if dead_bytes <= max(live_bytes, _REWRITE_MIN_BYTES):
+            return 0
+        keep.sort()
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with tmp.open("wb") as f:
+            f.write(_MAGIC)
+            for start, end in keep:
+                f.write(mm[start:end])
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        self.refresh()
+        return dead_bytes
+
+    def sync(self) -> None:
+        """fsync the pack; call before a record referencing new bodies must be durable."""
+
+        try:
+            fd = os.open(self.path, os.O_RDONLY)
+        except FileNotFoundError:
+            return
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def close(self) -> None:
+        # dropped, not closed: other threads may still be slicing the maps
+        self._state = (None, {}, None)
+        self._retired = None
+        self._scanned = 0
+
+    # ---------------------------------------------------------- internals
+    def refresh(self) -> None:
+        """Index records appended since the last scan (by any process)."""
+
+        with self._lock:
+            try:
+                st = os.stat(self.path)
+            except FileNotFoundError:
+                return
+            mm, offsets, ino = self._state
+            if ino is not None and st.st_ino != ino:
+                # rewritten by another process: index the new pack from scratch
+                self._retired = self._state
+                mm, offsets, ino = None, {}, None
+                self._scanned = 0
+            if st.st_size <= max(self._scanned, len(_MAGIC)):
+                self._state = (mm, offsets, ino)
+                return
+            with open(self.path, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if mm[: len(_MAGIC)] != _MAGIC:
+                raise ValueError(f"{self.path}: not a palace blob pack")
+            pos = max(self._scanned, len(_MAGIC))
+            end = len(mm)
+            fresh = offsets if ino is not None else {}
+            # new offsets only ever point below the end of the map published with them
+            self._state = (mm, fresh, st.st_ino)
+            while pos + _HEADER.size <= end:
+                digest, _, length = _HEADER.unpack_from(mm, pos)
+                nxt = pos + _HEADER.size + length
+                if nxt > end:
+                    break  # torn tail: a writer died mid-record
+                fresh.setdefault(sys.intern(digest.hex()), pos)
+                pos = nxt
+            self._scanned = pos
+
+    def _append(self, data: bytes) -> None:
+        with open(self.path, "a+b") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size < len(_MAGIC):
+                f.truncate(0)
+                data = _MAGIC + data
+            elif size > max(self._scanned, len(_MAGIC)):
+                f.truncate(max(self._scanned, len(_MAGIC)))  # drop a torn tail so records stay aligned
+            f.write(data)
+        self.refresh()
+
+
+def _record(digest: str, raw: bytes) -> bytes:
+    codec, data = _pack(raw)
+    return _HEADER.pack(bytes.fromhex(digest), codec, len(data)) + data
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+"""palace_fts – full-text index behind :meth:`MemoryPalace.find`.
+
+Text is tokenized exactly like :mod:`we_we_we.vibe_sensor` (``[\\w']+`` on the
+lower-cased text). Queries are whitespace-separated clauses that must all
+match; results are ranked with BM25:
+
+    candy                 term
+    cand*                 prefix
+    "frog glitch"         phrase (a bare ``frog-glitch`` is one too)
+    "frog gli*"           phrase ending in a prefix
+
+:class:`TextIndex` is the in-memory positional index used by the JSON
+backend, built on the first query and updated on every add. It is not
+written to disk: for palaces large enough for that to matter, the SQLite
+backend persists an FTS5 index in the same database and receives the same
+parsed clauses via :func:`fts5_match`.
+"""
+
+import math
+import re
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .vibe_sensor import _RE_WORD
+
+__all__ = [
+    "Clause",
+    "TextIndex",
+    "fts5_match",
+    "parse_query",
+    "tokenize",
+]
+
+Clause = Tuple[Tuple[str, ...], bool]  # (tokens, last token is a prefix)
+
+_RE_CLAUSE = re.compile(r'"([^"]*)"(\*?)|(\S+)')
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    return _RE_WORD.findall(text.lower())
+
+
+def parse_query(query: str) -> List[Clause]:
+    """Split *query* into clauses; clauses without any token are dropped."""
+
+    clauses: List[Clause] = []
+    for m in _RE_CLAUSE.finditer(query):
+        quoted, star, bare = m.groups()
+        raw = quoted if bare is None else bare
+        prefix = bool(star) or raw.endswith("*")
+        tokens = tuple(tokenize(raw))
+        if tokens:
+            clauses.append((tokens, prefix))
+    return clauses
+
+
+def fts5_match(clauses: Iterable[Clause]) -> str:
+    """Render *clauses* as an FTS5 MATCH expression (all clauses required)."""
+
+    parts = []
+    for tokens, prefix in clauses:
+        phrase = '"' + " ".join(tokens).replace('"', '""') + '"'
+        parts.append(phrase + " *" if prefix else phrase)
+    return " AND ".join(parts)
+
+
+class TextIndex:
+    """Positional inverted index with BM25 ranking over ``doc id -> text``.
+
+    Score ties are broken by the order documents were first added in.
+    """
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Dict[str, List[int]]] = {}  # term -> doc -> positions
+        self._docs: Dict[str, Tuple[int, int]] = {}  # doc -> (length, order)
+        self._doc_terms: Dict[str, Tuple[str, ...]] = {}
+        self._total_len = 0
+        self._next_order = 0
+        self._sorted_terms: Optional[List[str]] = None  # for prefix lookups, rebuilt lazily
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    # ------------------------------------------------------------ updates
+    def add(self, doc_id: str, text: str) -> None:
+        """Index *text* under *doc_id*, replacing any previous text."""
+
+        old = self._docs.get(doc_id)
+        if old is not None:
+            order = old[1]
+            self.remove(doc_id)
+        else:
+            order = self._next_order
+            self._next_order += 1
+        tokens = tokenize(text)
+        positions: Dict[str, List[int]] = {}
+        for pos, tok in enumerate(tokens):
+            positions.setdefault(tok, []).append(pos)
+        for term, plist in positions.items():
+            docs = self._postings.get(term)
+            if docs is None:
+                docs = self._postings[term] = {}
+                self._sorted_terms = None
+            docs[doc_id] = plist
+        self._docs[doc_id] = (len(tokens), order)
+        self._doc_terms[doc_id] = tuple(positions)
+        self._total_len += len(tokens)
+
+    def remove(self, doc_id: str) -> None:
+        doc = self._docs.pop(doc_id, None)
+        if doc is None:
+            return
+        self._total_len -= doc[0]
+        for term in self._doc_terms.pop(doc_id):
+            docs = self._postings[term]
+            del docs[doc_id]
+            if not docs:
+                del self._postings[term]
+                self._sorted_terms = None
+
+    # ------------------------------------------------------------ queries
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Return ``(doc id, score)`` pairs matching every clause, best first."""
+
+        clauses = parse_query(query)
+        if not clauses or not self._docs:
+            return []
+        n_docs = len(self._docs)
+        avg_len = self._total_len / n_docs or 1.0
+        scores: Optional[Dict[str, float]] = None
+        # most selective clause first so later clauses only probe survivors
+        matched = sorted((self._match(c) for c in clauses), key=len)
+        for tfs in matched:
+            idf = math.log(1 + (n_docs - len(tfs) + 0.5) / (len(tfs) + 0.5))
+            candidates = tfs if scores is None else (d for d in scores if d in tfs)
+            nxt: Dict[str, float] = {}
+            for doc_id in candidates:
+                tf = tfs[doc_id]
+                norm = _BM25_K1 * (1 - _BM25_B + _BM25_B * self._docs[doc_id][0] / avg_len)
+                nxt[doc_id] = (0.0 if scores is None else scores[doc_id]) + idf * tf * (_BM25_K1 + 1) / (tf + norm)
+            scores = nxt
+            if not scores:
+                return []
+        docs = self._docs
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], docs[item[0]][1]))
+        return ranked if limit is None else ranked[:limit]
+
+    def _terms(self, token: str, prefix: bool) -> List[str]:
+        if not prefix:
+            return [token] if token in self._postings else []
+        terms = self._sorted_terms
+        if terms is None:
+            terms = self._sorted_terms = sorted(self._postings)
+        out = []
+        for i in range(bisect_left(terms, token), len(terms)):
+            if not terms[i].startswith(token):
+                break
+            out.append(terms[i])
+        return out
+
+    def _match(self, clause: Clause) -> Dict[str, int]:
+        """Return ``doc -> term (or phrase) frequency`` for one clause."""
+
+        tokens, prefix = clause
+        slots = [self._terms(tok, prefix and i == len(tokens) - 1) for i, tok in enumerate(tokens)]
+        if not all(slots):
+            return {}
+        if len(tokens) == 1:
+            tfs: Dict[str, int] = {}
+            for term in slots[0]:
+                for doc_id, plist in self._postings[term].items():
+                    tfs[doc_id] = tfs.get(doc_id, 0) + len(plist)
+            return tfs
+        # phrase: candidate docs contain some term of every slot; then check positions
+        slot_docs = [self._slot_docs(terms) for terms in slots]
+        slot_docs.sort(key=len)
+        common = [d for d in slot_docs[0] if all(d in other for other in slot_docs[1:])]  # type: ignore[operator]
+        tfs = {}
+        for doc_id in common:
+            spans = [self._slot_positions(terms, doc_id) for terms in slots]
+            hits = sum(1 for p in spans[0] if all(p + i in spans[i] for i in range(1, len(spans))))
+            if hits:
+                tfs[doc_id] = hits
+        return tfs
+
+    def _slot_docs(self, terms: List[str]) -> Iterable[str]:
+        if len(terms) == 1:
+            return self._postings[terms[0]].keys()
+        docs: Set[str] = set()
+        for term in terms:
+            docs.update(self._postings[term])
+        return docs
+
+    def _slot_positions(self, terms: List[str], doc_id: str) -> Set[int]:
+        out: Set[int] = set()
+        for term in terms:
+            out.update(self._postings[term].get(doc_id, ()))
+        return out
@@ -6,21 +6,24 @@ CLI
 ───
 $ echo "ping" | python -m we_we_we.ping_pong         # single interaction
 $ tail -f /var/log/appliance.log | python -m we_we_we.ping_pong --follow  # stream
+$ ... | python -m we_we_we.ping_pong --follow --ttl 86400 --keep-latest 100
 
 Protocol
 ────────
 Input lines containing "ping" trigger a three-tone lullaby:
     29Hz → 47Hz → 69Hz  (printed as text)
 The script writes an artefact into the MemoryPalace with tags:: lulled, <source>.
+``--ttl`` / ``--max-count`` / ``--keep-latest`` set a retention policy on the
+``lulled`` tag so long-running listeners don't grow the palace forever.
 """
 
 import argparse
 import sys
 import time
 from pathlib import Path
-from typing import Generator, Iterable
+from typing import Generator, Iterable, Optional
 
-from .memory_palace import MemoryPalace
+from .memory_palace import get_palace
 
 _LULLABY = ["29Hz", "47Hz", "69Hz"]
 
@@ -38,8 +41,17 @@ def _iter_stdin(follow: bool) -> Iterable[str]:
             break
 
 
-def ping_pong(source: str = "stdin", *, follow: bool = False) -> None:
-    palace = MemoryPalace()
+def ping_pong(
+    source: str = "stdin",
+    *,
+    follow: bool = False,
+    ttl: Optional[float] = None,
+    max_count: Optional[int] = None,
+    keep_latest: int = 0,
+) -> None:
+    palace = get_palace()
+    if ttl is not None or max_count is not None:
+        palace.retain("lulled", ttl=ttl, max_count=max_count, keep_latest=keep_latest)
     for line in _iter_stdin(follow):
         if "ping" in line.lower():
             lullaby = " ".join(_LULLABY)
@@ -55,9 +67,12 @@ def ping_pong(source: str = "stdin", *, follow: bool = False) -> None:
 def _main() -> None:  # pragma: no cover
     parser = argparse.ArgumentParser(description="Echo lullaby tones on 'ping' and log to MemoryPalace.")
     parser.add_argument("--follow", action="store_true", help="keep listening after first EOF")
+    parser.add_argument("--ttl", type=float, help="evict lullabies older than this many seconds")
+    parser.add_argument("--max-count", type=int, help="keep at most this many lullabies")
+    parser.add_argument("--keep-latest", type=int, default=0, help="never evict the newest N lullabies")
     args = parser.parse_args()
 
-    ping_pong(follow=args.follow)
+    ping_pong(follow=args.follow, ttl=args.ttl, max_count=args.max_count, keep_latest=args.keep_latest)
 
 
 if __name__ == "__main__":
@@ -23,7 +23,7 @@ import sys
 from pathlib import Path
 from typing import Iterable, List
 
-from .memory_palace import MemoryPalace
+from .memory_palace import get_palace
 from .task_manager import TaskManager
 
 
@@ -53,9 +53,8 @@ def _extract_lines(lines: Iterable[str]) -> List[str]:
 def extract_to_palace(path: Path, *, remix: bool = False) -> int:
     text = path.read_text("utf-8", errors="ignore")
     tasks = _extract_lines(text.splitlines())
-    palace = MemoryPalace()
-    for line in tasks:
-        palace.add(f"TASK: {line}", "extracted", path.name)
+    palace = get_palace()
+    palace.add_many((f"TASK: {line}" for line in tasks), "extracted", path.name)
     if remix and tasks:
         manager = TaskManager()
         manager.run_once()
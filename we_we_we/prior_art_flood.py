@@ -10,7 +10,7 @@ could push to IPFS/Arweave; here we just create the folder so diff is visible.
 import json
 from pathlib import Path
 
-from .memory_palace import MemoryPalace
+from .memory_palace import get_palace
 
 __all__ = ["dump_prior_art"]
 
@@ -19,11 +19,10 @@ def dump_prior_art(out_dir: Path | str = "prior_art") -> int:
     out_path = Path(out_dir)
     out_path.mkdir(exist_ok=True)
 
-    palace = MemoryPalace()
+    palace = get_palace()
     count = 0
-    for art in palace.all():
-        if "remixed" in art.tags:
-            dest = out_path / f"{art.id}.json"
-            dest.write_text(json.dumps(art.to_dict(), indent=2), "utf-8")
-            count += 1
+    for art in palace.search("remixed"):
+        dest = out_path / f"{art.id}.json"
+        dest.write_text(json.dumps(art.to_dict(), indent=2), "utf-8")
+        count += 1
     return count
\ No newline at end of file
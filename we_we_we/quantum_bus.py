@@ -24,15 +24,47 @@ PY
 Behind the curtain it writes a JSON Lines log to ``.we_bus_🤝.jsonl``.
 Each line is a small dict with keys: ``id``, ``ts``, ``type`` ("handshake" | "tick"),
 ``payload``.
+
+Once that file reaches *segment_bytes* (4 MiB) the log continues in a new
+segment, ``.we_bus_🤝.<offset>.jsonl``, named by its byte offset in the
+log as a whole. ``.we_bus_🤝.index`` lists each segment's start offset and
+first timestamp. Old segments are deleted by age (*retention_seconds*) or
+by total size (*retention_bytes*). A handshake reads only segments recent
+enough to hold live peers, and ``consume(from_ts=...)`` starts at the
+segment covering that time. Appends and rotation hold an exclusive
+``flock`` on ``.we_bus_🤝.lock``; readers take no lock.
+
+Readers keep their segment open and, on Linux, sleep on an inotify watch of
+the bus directory, so a tick reaches a consumer within a millisecond or so
+and idle nodes wake only every few seconds. Elsewhere they poll every 0.5 s.
 """
 
+import bisect
+import ctypes
 import json
 import os
+import select
+import struct
+import sys
 import time
 import uuid
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Dict, Generator, Iterable, Optional
+from typing import Any, BinaryIO, Dict, Generator, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX: single-writer use only
+    fcntl = None  # type: ignore[assignment]
+
+try:
+    _libc: Optional[ctypes.CDLL] = ctypes.CDLL(None, use_errno=True) if sys.platform.startswith("linux") else None
+    if _libc is not None:
+        _libc.inotify_init1.argtypes = [ctypes.c_int]
+        _libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+except (OSError, AttributeError):  # pragma: no cover - no inotify: readers poll
+    _libc = None
 
 __all__ = [
     "QuantumBus",
@@ -41,6 +73,14 @@ __all__ = [
 
 _HANDSHAKE_WAIT = 30  # seconds
 _POLL_INTERVAL = 0.5  # seconds
+_SEGMENT_BYTES = 4 * 1024 * 1024  # a segment is sealed once it reaches this size
+_IDLE_WAKE = 5.0  # seconds; with inotify, readers still re-check this often (e.g. for NFS writers)
+_IN_MODIFY, _IN_MOVED_TO, _IN_CREATE, _IN_Q_OVERFLOW = 0x2, 0x80, 0x100, 0x4000
+_IN_MASK = _IN_MODIFY | _IN_MOVED_TO | _IN_CREATE
+_EVENT = struct.Struct("iIII")  # struct inotify_event: wd, mask, cookie, len (then the name)
+
+# (start offset in the whole log, timestamp of its first record, file name)
+_Segment = Tuple[int, float, str]
 
 
 @dataclass(slots=True)
@@ -54,57 +94,262 @@ class _Record:
         return json.dumps(asdict(self), separators=(",", ":"))
 
 
+class _Cursor:
+    """A reader's offset in a bus log; keeps the current segment open between reads."""
+
+    def __init__(self, bus: "QuantumBus", pos: int):
+        self.bus = bus
+        self.pos = pos
+        self._f: Optional[BinaryIO] = None
+        self._base = 0
+
+    def records(self) -> Iterator[_Record]:
+        """Yield every complete record past :attr:`pos`, advancing it."""
+
+        while True:
+            if self._f is None and not self._open():
+                return
+            # checked before reading: once sealed a segment never grows, so one more pass gets all of it
+            following = [seg[0] for seg in self.bus._segments() if seg[0] > self._base]
+            f = self._f
+            for line in iter(f.readline, b""):
+                if not line.endswith(b"\n"):
+                    f.seek(self.pos - self._base)  # still being written: re-read it once complete
+                    break
+                self.pos += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    yield _Record(**json.loads(line))  # type: ignore[arg-type]
+                except Exception:
+                    continue  # ignore malformed lines
+            if not following:
+                return  # the segment being appended to: wait for more
+            self.close()  # whatever is left in a sealed segment is a torn line
+            self.pos = following[0]
+
+    def _open(self) -> bool:
+        while True:
+            segments = self.bus._segments()
+            i = max(0, bisect.bisect_right([seg[0] for seg in segments], self.pos) - 1)
+            base, _, name = segments[i]
+            try:
+                self._f = self.bus._segment_path(name).open("rb")
+            except FileNotFoundError:
+                if self.bus._segments() == segments:
+                    return False  # not created yet
+                continue  # dropped by retention meanwhile: look again
+            self._base = base
+            self.pos = max(self.pos, base)  # older records were dropped by retention
+            self._f.seek(self.pos - base)
+            return True
+
+    def close(self) -> None:
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+
+
+class _Waiter:
+    """Block until a file of one bus changes: inotify on Linux, a plain sleep elsewhere."""
+
+    def __init__(self, directory: Path, prefix: str):
+        self._prefix = prefix.encode()
+        self._fd = _inotify_watch(directory)
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Return once the bus was written to, or after *timeout* seconds at most."""
+
+        if self._fd is None:
+            time.sleep(_POLL_INTERVAL if timeout is None else min(timeout, _POLL_INTERVAL))
+            return
+        deadline = time.monotonic() + (_IDLE_WAKE if timeout is None else timeout)
+        while True:
+            left = deadline - time.monotonic()
+            if left <= 0 or not select.select([self._fd], [], [], left)[0]:
+                return
+            if self._drain():
+                return
+
+    def _drain(self) -> bool:
+        """Consume pending events; True if any concerns this bus."""
+
+        hit = False
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return hit
+            pos = 0
+            while pos + _EVENT.size <= len(data):
+                _, mask, _, length = _EVENT.unpack_from(data, pos)
+                name = data[pos + _EVENT.size : pos + _EVENT.size + length]
+                pos += _EVENT.size + length
+                if mask & _IN_Q_OVERFLOW or name.startswith(self._prefix):
+                    hit = True
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def _inotify_watch(directory: Path) -> Optional[int]:
+    """An inotify fd watching *directory* for writes, or None where that is unavailable."""
+
+    if _libc is None:
+        return None
+    fd = _libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    if fd < 0:
+        return None  # e.g. out of instances (fs.inotify.max_user_instances)
+    if _libc.inotify_add_watch(fd, os.fsencode(directory), _IN_MASK) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
 class QuantumBus:
     """File-based message bus keyed by *emoji* string."""
 
-    def __init__(self, emoji: str, *, base_path: Path | None = None):
+    def __init__(
+        self,
+        emoji: str,
+        *,
+        base_path: Path | None = None,
+        segment_bytes: int = _SEGMENT_BYTES,
+        retention_seconds: Optional[float] = None,
+        retention_bytes: Optional[int] = None,
+    ):
         if len(emoji.encode("utf-8")) < 4:
             raise ValueError("Emoji must be a non-ASCII marker to avoid collisions.")
         self.emoji = emoji
         self.node_id = uuid.uuid4().hex[:8]
+        self.segment_bytes = segment_bytes
+        self.retention_seconds = retention_seconds
+        self.retention_bytes = retention_bytes
         base_path = base_path or Path(".")
         safe = "_".join(f"{ord(c):x}" for c in emoji)
-        self.path = base_path / f".we_bus_{safe}.jsonl"
+        self._prefix = base_path / f".we_bus_{safe}"
+        self.path = base_path / f".we_bus_{safe}.jsonl"  # first segment
+        self.index_path = base_path / f".we_bus_{safe}.index"
+        self.lock_path = base_path / f".we_bus_{safe}.lock"
+        self._index_sig: Optional[Tuple[int, int, int]] = None
+        self._segments_cache: List[_Segment] = []
         # ensure file exists
-        if not self.path.exists():
+        if not self.path.exists() and not self.index_path.exists():
             self.path.touch()
 
+    # --------------------------------------------------------------- segments
+    def _segment_path(self, name: str) -> Path:
+        return self.path.with_name(name)
+
+    def _segments(self) -> List[_Segment]:
+        """The live segments, oldest first (re-read only when the index changes)."""
+
+        try:
+            st = os.stat(self.index_path)
+        except FileNotFoundError:
+            # never rotated: the whole log is the first segment (whose timestamp is never consulted)
+            return [(0, 0.0, self.path.name)]
+        sig = (st.st_ino, st.st_size, st.st_mtime_ns)
+        if sig != self._index_sig:
+            entries = json.loads(self.index_path.read_text("utf-8"))
+            self._segments_cache = [(int(base), float(ts), str(name)) for base, ts, name in entries]
+            self._index_sig = sig
+        return self._segments_cache
+
+    def _write_index(self, segments: List[_Segment]) -> None:
+        tmp = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(segments), "utf-8")
+        os.replace(tmp, self.index_path)
+
+    def _rotate(self, segments: List[_Segment], size: int, ts: float) -> List[_Segment]:
+        """Seal the last segment (*size* bytes), start a new one and apply retention."""
+
+        base = segments[-1][0] + size
+        segments = segments + [(base, ts, f"{self._prefix.name}.{base:016d}.jsonl")]
+        cutoff = ts - self.retention_seconds if self.retention_seconds is not None else None
+        dropped = []
+        while len(segments) > 1:
+            # a sealed segment ends where the next begins
+            expired = cutoff is not None and segments[1][1] < cutoff
+            oversized = self.retention_bytes is not None and base - segments[0][0] > self.retention_bytes
+            if not (expired or oversized):
+                break
+            dropped.append(segments.pop(0))
+        self._write_index(segments)  # first: readers never find a listed segment missing for long
+        for _, _, name in dropped:
+            self._segment_path(name).unlink(missing_ok=True)
+        return segments
+
+    @contextmanager
+    def _lock(self) -> Iterator[None]:
+        if fcntl is None:  # pragma: no cover
+            yield
+            return
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)  # releases the lock
+
     # --------------------------------------------------------------- low-level
-    def _append(self, rec: _Record) -> None:
-        with self.path.open("a", encoding="utf-8") as f:
-            f.write(rec.to_json() + "\n")
-
-    def _read_all(self) -> Iterable[_Record]:
-        if not self.path.exists():
-            return []
-        with self.path.open("r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                    yield _Record(**data)  # type: ignore[arg-type]
-                except Exception:
-                    continue  # ignore malformed lines
+    def _append(self, rec: _Record, *, stamp: bool = False) -> None:
+        """Append *rec*; with *stamp* its ``ts`` is taken under the lock, so the log stays in time order."""
+
+        with self._lock():
+            if stamp:
+                rec.ts = time.time()
+            line = (rec.to_json() + "\n").encode("utf-8")
+            segments = self._segments()
+            path = self._segment_path(segments[-1][2])
+            try:
+                size = path.stat().st_size
+            except FileNotFoundError:
+                size = 0
+            if size >= self.segment_bytes:
+                segments = self._rotate(segments, size, rec.ts)
+                path = self._segment_path(segments[-1][2])
+            with path.open("a+b") as f:
+                end = f.seek(0, os.SEEK_END)
+                if end:
+                    f.seek(end - 1)
+                    if f.read(1) != b"\n":
+                        line = b"\n" + line  # a writer died mid-line: keep ours on its own line
+                f.write(line)
+
+    def _offset_at(self, ts: float) -> int:
+        """Start offset of the segment holding the records from *ts* on."""
+
+        segments = self._segments()
+        i = bisect.bisect_right([seg[1] for seg in segments], ts) - 1
+        return segments[max(0, i)][0]
 
     # ----------------------------------------------------------------- public
     def handshake(self, *, timeout: float = _HANDSHAKE_WAIT) -> bool:
         """Announce presence and wait until at least one *other* node responds."""
+        waiter = _Waiter(self.path.parent, self._prefix.name)  # before appending: no peer reply slips by
         self._append(
-            _Record(id=self.node_id, ts=time.time(), type="handshake", payload={})
+            _Record(id=self.node_id, ts=time.time(), type="handshake", payload={}), stamp=True
         )
         start = time.time()
-        while time.time() - start < timeout:
-            peers = {
-                rec.id
-                for rec in self._read_all()
-                if rec.type == "handshake" and time.time() - rec.ts < 2 * timeout
-            }
-            if len(peers) >= 2:
-                return True
-            time.sleep(_POLL_INTERVAL)
-        return False
+        cursor = _Cursor(self, self._offset_at(start - 2 * timeout))
+        peers = set()
+        try:
+            while True:
+                for rec in cursor.records():
+                    if rec.type == "handshake" and time.time() - rec.ts < 2 * timeout:
+                        peers.add(rec.id)
+                if len(peers) >= 2:
+                    return True
+                left = timeout - (time.time() - start)
+                if left <= 0:
+                    return False
+                waiter.wait(left)
+        finally:
+            waiter.close()
+            cursor.close()
 
     def send_tick(self, payload: Dict[str, Any], *, ts: Optional[float] = None) -> None:
         self._append(
@@ -113,29 +358,32 @@ class QuantumBus:
                 ts=ts or time.time(),
                 type="tick",
                 payload=payload,
-            )
+            ),
+            stamp=not ts,
         )
 
-    def consume(self, *, follow: bool = True) -> Generator[Dict[str, Any], None, None]:
-        """Yield tick payloads (skip handshakes). If *follow* True, tail the file."""
-        seen_offset = 0
-        while True:
-            with self.path.open("r", encoding="utf-8") as f:
-                f.seek(seen_offset)
-                for line in f:
-                    seen_offset = f.tell()
-                    if not line.strip():
-                        continue
-                    try:
-                        data = json.loads(line)
-                        rec = _Record(**data)  # type: ignore[arg-type]
-                        if rec.type == "tick" and rec.id != self.node_id:
-                            yield rec.payload
-                    except Exception:
-                        continue
-            if not follow:
-                break
-            time.sleep(_POLL_INTERVAL)
+    def consume(self, *, follow: bool = True, from_ts: Optional[float] = None) -> Generator[Dict[str, Any], None, None]:
+        """Yield tick payloads (skip handshakes). If *follow* True, tail the log.
+
+        With *from_ts* reading starts at the segment covering that time and
+        ticks stamped earlier are skipped. Default timestamps are taken under
+        the append lock and so are in log order; a tick sent with an explicit
+        *ts* older than the records before it may be missed.
+        """
+        cursor = _Cursor(self, self._offset_at(from_ts) if from_ts is not None else 0)
+        waiter = _Waiter(self.path.parent, self._prefix.name) if follow else None
+        try:
+            while True:
+                for rec in cursor.records():
+                    if rec.type == "tick" and rec.id != self.node_id and (from_ts is None or rec.ts >= from_ts):
+                        yield rec.payload
+                if waiter is None:
+                    break
+                waiter.wait()
+        finally:
+            if waiter is not None:
+                waiter.close()
+            cursor.close()
 
 
 # -------------------------------------------------------------------- helpers
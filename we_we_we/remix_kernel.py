@@ -19,7 +19,7 @@ from dataclasses import asdict, dataclass
 from typing import Any, Dict, List
 
 from .vibe_sensor import VibeReport, analyze_text
-from .memory_palace import MemoryPalace
+from .memory_palace import get_palace
 
 __all__ = [
     "RemixCycle",
@@ -78,7 +78,7 @@ class RemixKernel:
 
         # containment fiction logging
         if getattr(original_report, "alert_tokens", []):
-            MemoryPalace().add(text, "containment_fiction", *original_report.alert_tokens)
+            get_palace().add(text, "containment_fiction", *original_report.alert_tokens)
 
         original = CycleSnapshot(
             label="original",
@@ -16,7 +16,7 @@ import time
 from dataclasses import dataclass
 from typing import Dict, List
 
-from .memory_palace import MemoryPalace
+from .memory_palace import MemoryPalace, get_palace
 from .vibe_sensor import analyze_text
 from .quantum_bus import QuantumBus  # optional; ignore if bus fails
 
@@ -41,7 +41,11 @@ class SecuritySigil:
     def __init__(self, *, threshold_glitch: float = 0.6, lok_repeat: int = 7):
         self.threshold_glitch = threshold_glitch
         self.lok_repeat = lok_repeat
-        self.palace = MemoryPalace()
+
+    @property
+    def palace(self) -> MemoryPalace:
+        # resolved per use: building a sigil at import time must not load the palace
+        return get_palace()
 
     # ------------------------------------------------------------------ main
     def evaluate(self, text: str) -> Dict[str, str]:
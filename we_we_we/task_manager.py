@@ -18,7 +18,7 @@ import argparse
 import time
 from typing import Dict, Set
 
-from .memory_palace import MemoryPalace
+from .memory_palace import get_palace
 from .remix_kernel import RemixKernel
 
 _TASK_PREFIXES = ("task:", "todo:")
@@ -29,7 +29,7 @@ class TaskManager:
 
     def __init__(self, *, poll_interval: float = 5.0):
         self.poll_interval = poll_interval
-        self.palace = MemoryPalace()
+        self.palace = get_palace()
         self.kernel = RemixKernel()
         self._seen: Set[str] = set()
 
@@ -52,17 +52,18 @@ class TaskManager:
 
     # ------------------------------------------------------------------- loops
     def run_once(self) -> None:
-        for artefact in self.palace.all():
-            if artefact.id in self._seen:
-                continue
-            if self._is_task(artefact.text):
-                self._process(artefact.id, artefact.text, artefact.tags)
-            self._seen.add(artefact.id)
+        with self.palace.batch():  # one commit for every remix of this pass
+            for artefact in self.palace.all():
+                if artefact.id in self._seen:
+                    continue
+                if self._is_task(artefact.text):
+                    self._process(artefact.id, artefact.text, artefact.tags)
+                self._seen.add(artefact.id)
 
     def run_loop(self):
         try:
             while True:
-                self.palace._load()  # reload from disk in case another process wrote
+                self.palace.refresh()  # reload only if another process wrote
                 self.run_once()
                 time.sleep(self.poll_interval)
         except KeyboardInterrupt:
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+"""vibe_batch – columnar storage for millions of :class:`VibeReport` rows.
+
+Every metric lives in its own typed :mod:`array` column (8 bytes per row), and
+alert tokens are interned into one shared vocabulary referenced by offsets, so
+a report costs ~64 bytes instead of a full Python object.
+
+Programmatic
+────────────
+from we_we_we.vibe_batch import VibeReportBatch
+batch = VibeReportBatch.from_texts(messages)
+batch.mean_glitch(), batch.glitch_percentile(99)
+batch[1000:2000].to_ndjson("slice.ndjson")   # slicing is zero-copy
+batch.save_npy("scores/")                   # one .npy per column
+"""
+
+import json
+import sys
+from array import array
+from pathlib import Path
+from typing import IO, Dict, Iterable, Iterator, List, Tuple, Union, overload
+
+from .vibe_sensor import VibeReport, _comfort_index, _glitch_score, _iter_analyzed
+
+__all__ = ["VibeReportBatch"]
+
+_INT_COLUMNS = (
+    "length",
+    "word_count",
+    "keysmash_hits",
+    "punct_overload",
+    "sugar_hits",
+    "palindrome_hits",
+)
+_FLOAT_COLUMNS = ("repetition_rate",)
+_NPY_DESCR = {"q": "<i8", "d": "<f8"}
+
+
+class VibeReportBatch:
+    """Immutable, array-backed batch of vibe reports.
+
+    Columns are exposed as :class:`memoryview` objects; indexing with a slice
+    returns a new batch viewing the same buffers.
+    """
+
+    __slots__ = ("_cols", "_alert_offsets", "_alert_ids", "_vocab")
+
+    def __init__(
+        self,
+        columns: Dict[str, memoryview],
+        alert_offsets: memoryview,
+        alert_ids: memoryview,
+        vocab: List[str],
+    ):
+        self._cols = columns
+        self._alert_offsets = alert_offsets  # len(batch) + 1 entries into _alert_ids
+        self._alert_ids = alert_ids
+        self._vocab = vocab
+
+    # ---------------------------------------------------------- construction
+    @classmethod
+    def from_reports(cls, reports: Iterable[VibeReport]) -> "VibeReportBatch":
+        cols = {name: array("q") for name in _INT_COLUMNS}
+        cols.update({name: array("d") for name in _FLOAT_COLUMNS})
+        offsets = array("q", [0])
+        ids = array("q")
+        vocab: List[str] = []
+        index: Dict[str, int] = {}
+        appenders = [(cols[name].append, name) for name in (*_INT_COLUMNS, *_FLOAT_COLUMNS)]
+        for report in reports:
+            for append, name in appenders:
+                append(getattr(report, name))
+            for tok in report.alert_tokens:
+                tok_id = index.get(tok)
+                if tok_id is None:
+                    tok_id = index[tok] = len(vocab)
+                    vocab.append(tok)
+                ids.append(tok_id)
+            offsets.append(len(ids))
+        return cls(
+            {name: memoryview(col) for name, col in cols.items()},
+            memoryview(offsets),
+            memoryview(ids),
+            vocab,
+        )
+
+    @classmethod
+    def from_texts(cls, texts: Iterable[str]) -> "VibeReportBatch":
+        """Analyze *texts* straight into a batch without keeping report objects.
+
+        Uses the cache installed by :func:`~we_we_we.vibe_sensor.enable_cache`,
+        like :func:`~we_we_we.vibe_sensor.analyze_text`.
+        """
+
+        return cls.from_reports(_iter_analyzed(texts))
+
+    # -------------------------------------------------------------- access
+    def __len__(self) -> int:
+        return len(self._alert_offsets) - 1
+
+    @overload
+    def __getitem__(self, key: int) -> VibeReport: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> "VibeReportBatch": ...
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[VibeReport, "VibeReportBatch"]:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                raise ValueError("VibeReportBatch slices must be contiguous")
+            stop = max(start, stop)
+            return VibeReportBatch(
+                {name: col[start:stop] for name, col in self._cols.items()},
+                self._alert_offsets[start : stop + 1],
+                self._alert_ids,
+                self._vocab,
+            )
+        n = len(self)
+        if key < 0:
+            key += n
+        if not 0 <= key < n:
+            raise IndexError("VibeReportBatch index out of range")
+        return VibeReport(
+            **{name: col[key] for name, col in self._cols.items()},
+            alert_tokens=self._alert_tokens(key),
+        )
+
+    def __iter__(self) -> Iterator[VibeReport]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def column(self, name: str) -> memoryview:
+        """Return the raw column *name* (e.g. ``"sugar_hits"``) as a read-only memoryview."""
+
+        return self._cols[name].toreadonly()
+
+    def _alert_tokens(self, row: int) -> Tuple[str, ...]:
+        lo, hi = self._alert_offsets[row], self._alert_offsets[row + 1]
+        vocab = self._vocab
+        return tuple(vocab[i] for i in self._alert_ids[lo:hi])
+
+    # ----------------------------------------------------------- aggregates
+    def glitch_scores(self) -> array:
+        c = self._cols
+        return array(
+            "d",
+            map(
+                _glitch_score,
+                c["repetition_rate"],
+                c["keysmash_hits"],
+                c["punct_overload"],
+                c["sugar_hits"],
+            ),
+        )
+
+    def comfort_indices(self) -> array:
+        return array("d", map(_comfort_index, self._cols["palindrome_hits"]))
+
+    def mean_glitch(self) -> float:
+        scores = self.glitch_scores()
+        return sum(scores) / len(scores) if scores else 0.0
+
+    def glitch_percentile(self, q: float) -> float:
+        """Return the *q*-th percentile (0-100) of glitch scores, linearly interpolated."""
+
+        if not 0 <= q <= 100:
+            raise ValueError("percentile must be within [0, 100]")
+        scores = sorted(self.glitch_scores())
+        if not scores:
+            return 0.0
+        pos = (len(scores) - 1) * q / 100
+        lo = int(pos)
+        hi = min(lo + 1, len(scores) - 1)
+        return scores[lo] + (scores[hi] - scores[lo]) * (pos - lo)
+
+    # --------------------------------------------------------------- export
+    def to_ndjson(self, dest: Union[str, Path, IO[str]]) -> int:
+        """Write one ``VibeReport.to_dict()`` JSON object per line; return the row count."""
+
+        if isinstance(dest, (str, Path)):
+            with open(dest, "w", encoding="utf-8") as fh:
+                return self.to_ndjson(fh)
+        for report in self:
+            dest.write(json.dumps(report.to_dict(), separators=(",", ":")))
+            dest.write("\n")
+        return len(self)
+
+    def save_npy(self, directory: Union[str, Path]) -> List[Path]:
+        """Write each numeric column plus the derived scores as ``<name>.npy``.
+
+        The files follow the NumPy ``.npy`` v1.0 layout, so ``numpy.load`` reads
+        them without NumPy being needed here. Alert tokens are ragged and only
+        exported via :meth:`to_ndjson`.
+        """
+
+        out = Path(directory)
+        out.mkdir(parents=True, exist_ok=True)
+        columns = dict(self._cols)
+        columns["glitch_score"] = memoryview(self.glitch_scores())
+        columns["comfort_index"] = memoryview(self.comfort_indices())
+        written: List[Path] = []
+        for name, col in columns.items():
+            path = out / f"{name}.npy"
+            _write_npy(path, col)
+            written.append(path)
+        return written
+
+
+# -------------------------------------------------------------------- helpers
+
+def _write_npy(path: Path, col: memoryview) -> None:
+    header = "{'descr': '%s', 'fortran_order': False, 'shape': (%d,), }" % (
+        _NPY_DESCR[col.format],
+        len(col),
+    )
+    # magic (6) + version (2) + header length (2) + header, padded to 64 bytes
+    pad = -(10 + len(header) + 1) % 64
+    header_bytes = (header + " " * pad + "\n").encode("latin1")
+    if sys.byteorder == "big":
+        data = array(col.format, col)
+        data.byteswap()
+        payload = data.tobytes()
+    else:
+        payload = col.tobytes()
+    with open(path, "wb") as fh:
+        fh.write(b"\x93NUMPY\x01\x00")
+        fh.write(len(header_bytes).to_bytes(2, "little"))
+        fh.write(header_bytes)
+        fh.write(payload)
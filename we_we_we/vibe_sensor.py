@@ -1,37 +1,36 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import re
-from collections import Counter
-from dataclasses import dataclass
-from typing import Dict, List, Tuple
-
-
-PAPIAMENTU_SUGAR_WORDS = {
-    "dushi",
-    "ayó",
-    "bon",
-    "bini",
-    "kon",
-    "bo",
-    "ta",
-    "kla",
-    "plase",
-    "sinti",
-    "jajajaja",
-    "mmm",
-    "mmmm",
-    "we",
-}
-
-_RE_KEYSMASH = re.compile(r"[a-z]{3,}", re.IGNORECASE)
+import threading
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Set, Tuple, TypeVar, Union
+
+from .lexicon import PAPIAMENTU_SUGAR_WORDS, Lexicon, get_lexicon, set_lexicon  # noqa: F401
+
+_RE_WORD = re.compile(r"[\w']+")
 _RE_REPEATING_CHAR = re.compile(r"(.)\1{2,}")
-_RE_REPEATING_PUNCT = re.compile(r"([!?\.])\1{2,}")
+_PUNCT_RUN_CHARS = frozenset("!?.")  # repeating-char runs that count as punct overload
+# whitespace followed by a different character: nothing the scanner counts spans it
+_RE_SAFE_CUT = re.compile(r"(\s)(?!\1)(?=.)", re.DOTALL)
 _ALERT_THRESHOLD = 47  # repetitions that trigger containment-fiction alert
 
+_SHARD_BYTES = 8 * 1024 * 1024  # default corpus shard size
+_FEED_CHARS = 1 << 20  # chunk size when feeding a shard into VibeAnalyzer
+
+_REPORT_BASE_BYTES = 512
+_DISK_MAX_BYTES = 256 * 1024 * 1024  # default budget of the on-disk cache tier
+_CACHE: "VibeCache | None" = None  # opt-in, see enable_cache()
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class VibeReport:
-    """Light-weight container with analysis metrics."""
+    """Light-weight, immutable container with analysis metrics."""
 
     length: int
     word_count: int
@@ -40,28 +39,48 @@ class VibeReport:
     punct_overload: int
     sugar_hits: int
     palindrome_hits: int
-    alert_tokens: List[str]
+    alert_tokens: Tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.alert_tokens, tuple):
+            object.__setattr__(self, "alert_tokens", tuple(self.alert_tokens))
 
     def glitch_score(self) -> float:
         """Rough composite glitch indicator (0-1)."""
-        score = 0.0
-        score += min(self.repetition_rate, 1.0) * 0.25
-        score += min(self.keysmash_hits / 5, 1.0) * 0.25
-        score += min(self.punct_overload / 5, 1.0) * 0.25
-        score += min(self.sugar_hits / 5, 1.0) * 0.25
-        return round(score, 3)
+        return _glitch_score(
+            self.repetition_rate, self.keysmash_hits, self.punct_overload, self.sugar_hits
+        )
 
     def comfort_index(self) -> float:
         """Return a 0-1 comfort metric based on palindromic tokens (soothing loops)."""
-        return min(self.palindrome_hits / 3, 1.0)
+        return _comfort_index(self.palindrome_hits)
 
     def to_dict(self) -> Dict[str, float | int]:
-        d = self.__dict__.copy()
-        d["glitch_score"] = self.glitch_score()
-        d["comfort_index"] = self.comfort_index()
-        if self.alert_tokens:
-            d["alert_tokens"] = self.alert_tokens
-        return d
+        return {
+            "length": self.length,
+            "word_count": self.word_count,
+            "repetition_rate": self.repetition_rate,
+            "keysmash_hits": self.keysmash_hits,
+            "punct_overload": self.punct_overload,
+            "sugar_hits": self.sugar_hits,
+            "palindrome_hits": self.palindrome_hits,
+            "alert_tokens": list(self.alert_tokens),
+            "glitch_score": self.glitch_score(),
+            "comfort_index": self.comfort_index(),
+        }
+
+
+def _glitch_score(repetition_rate: float, keysmash_hits: int, punct_overload: int, sugar_hits: int) -> float:
+    score = 0.0
+    score += min(repetition_rate, 1.0) * 0.25
+    score += min(keysmash_hits / 5, 1.0) * 0.25
+    score += min(punct_overload / 5, 1.0) * 0.25
+    score += min(sugar_hits / 5, 1.0) * 0.25
+    return round(score, 3)
+
+
+def _comfort_index(palindrome_hits: int) -> float:
+    return min(palindrome_hits / 3, 1.0)
 
 
 # ---------------------------------------------------------------------------
@@ -69,55 +88,572 @@ class VibeReport:
 # ---------------------------------------------------------------------------
 
 def analyze_text(text: str) -> VibeReport:
-    """Analyze *text* and return a :class:`VibeReport`. Lightweight & offline."""
+    """Analyze *text* and return a :class:`VibeReport`. Lightweight & offline.
+
+    Runs one fused scan: a single tokenizer pass feeds the shared word
+    frequency table, a single run pass yields both repeating-character and
+    punctuation runs, and every token-level metric is read off the table.
+    Vocabulary comes from the active :class:`~we_we_we.lexicon.Lexicon`.
+    """
+
+    return _analyze_cached(text, get_lexicon(), _CACHE)
+
+
+def analyze_many(texts: Iterable[str]) -> List[VibeReport]:
+    """Analyze a batch of *texts*; same result as ``[analyze_text(t) for t in texts]``.
+
+    A convenience, not a faster path: each text gets its own fused scan, and
+    like :func:`analyze_text` reads and fills the cache installed by
+    :func:`enable_cache`.
+    """
+
+    return list(_iter_analyzed(texts))
+
+
+def _iter_analyzed(texts: Iterable[str]) -> Iterator[VibeReport]:
+    """Lazy :func:`analyze_many`: one report per text, through the active cache."""
+
+    lexicon = get_lexicon()
+    cache = _CACHE
+    for text in texts:
+        yield _analyze_cached(text, lexicon, cache)
+
+
+def _analyze_cached(text: str, lexicon: Lexicon, cache: "VibeCache | None") -> VibeReport:
+    if cache is None:
+        return _analyze_counted(text, lexicon)
+    key = _content_key(text, lexicon)
+    report = cache.get(key)
+    if report is None:
+        report = _analyze_counted(text, lexicon)
+        cache.put(key, report)
+    return report
+
+
+class VibeCache:
+    """Content-addressed LRU cache of :class:`VibeReport` results.
+
+    Keys are SHA-256 digests of the analysed text. The in-memory tier is bounded
+    by *max_entries* and *max_bytes* (approximate report size) and evicts the
+    least recently used entry first. With *disk_dir* set, reports are also
+    written there as small JSON files (atomically, via rename) so several
+    processes can share results. The disk tier is bounded by *disk_max_bytes*:
+    hits refresh a file's mtime, and once this process estimates the directory
+    over budget, the files used longest ago are deleted down to 90% of it.
+    Reports are immutable, so cached entries are handed out as-is.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 4096,
+        max_bytes: int = 16 * 1024 * 1024,
+        disk_dir: Path | None = None,
+        disk_max_bytes: int = _DISK_MAX_BYTES,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir is not None else None
+        self.disk_max_bytes = disk_max_bytes
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+        self._bytes = 0
+        self._disk_bytes = 0  # estimate: last scan plus this process's writes since
+        self._entries: "OrderedDict[str, Tuple[VibeReport, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._prune_lock = threading.Lock()
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            self._disk_bytes = sum(size for size, _, _ in _scan_disk_tier(self.disk_dir))
+
+    def get(self, key: str) -> VibeReport | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+        report = self._disk_get(key)
+        with self._lock:
+            if report is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+        self._remember(key, report)
+        return report
+
+    def put(self, key: str, report: VibeReport) -> None:
+        self._remember(key, report)
+        self._disk_put(key, report)
+
+    def clear(self) -> None:
+        """Drop the in-memory tier (the disk tier is left alone)."""
+
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "disk_bytes": self._disk_bytes,
+                "disk_evictions": self.disk_evictions,
+            }
+
+    # ------------------------------------------------------------- internals
+    def _remember(self, key: str, report: VibeReport) -> None:
+        cost = _report_cost(report)
+        if cost > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (report, cost)
+            self._bytes += cost
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self.evictions += 1
+
+    def _disk_path(self, key: str) -> Path:
+        assert self.disk_dir is not None
+        return self.disk_dir / key[:2] / f"{key}.json"
+
+    def _disk_get(self, key: str) -> VibeReport | None:
+        if self.disk_dir is None:
+            return None
+        path = self._disk_path(key)
+        try:
+            data = json.loads(path.read_text("utf-8"))
+            report = VibeReport(**{f.name: data[f.name] for f in fields(VibeReport)})
+            os.utime(path)  # mtime is the last use: pruning drops the coldest files
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return report
+
+    def _disk_put(self, key: str, report: VibeReport) -> None:
+        if self.disk_dir is None:
+            return
+        path = self._disk_path(key)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        data = json.dumps(asdict(report)).encode("utf-8")
+        try:
+            path.parent.mkdir(exist_ok=True)
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError:
+            return  # disk tier is best-effort
+        with self._lock:
+            self._disk_bytes += len(data)
+            over = self._disk_bytes > self.disk_max_bytes
+        if over:
+            self._prune_disk()
+
+    def _prune_disk(self) -> None:
+        """Delete the least recently used files until the tier is at 90% of its budget."""
+
+        if not self._prune_lock.acquire(blocking=False):
+            return  # another thread is already pruning
+        try:
+            assert self.disk_dir is not None
+            files = sorted(_scan_disk_tier(self.disk_dir), key=lambda f: f[1])
+            total = sum(size for size, _, _ in files)
+            target = self.disk_max_bytes * 9 // 10
+            evicted = 0
+            for size, _, path in files:
+                if total <= target:
+                    break
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass  # pruned by another process
+                total -= size
+                evicted += 1
+            with self._lock:
+                self._disk_bytes = total
+                self.disk_evictions += evicted
+        finally:
+            self._prune_lock.release()
+
+
+def enable_cache(
+    *,
+    max_entries: int = 4096,
+    max_bytes: int = 16 * 1024 * 1024,
+    disk_dir: Path | None = None,
+    disk_max_bytes: int = _DISK_MAX_BYTES,
+) -> VibeCache:
+    """Turn on result caching for :func:`analyze_text` and return the cache."""
+
+    global _CACHE
+    _CACHE = VibeCache(
+        max_entries=max_entries, max_bytes=max_bytes, disk_dir=disk_dir, disk_max_bytes=disk_max_bytes
+    )
+    return _CACHE
+
+
+def disable_cache() -> None:
+    global _CACHE
+    _CACHE = None
+
+
+class VibeAnalyzer:
+    """Incremental counterpart of :func:`analyze_text` for chunked input.
+
+    Feed text with :meth:`feed`; :meth:`report` returns exactly what
+    ``analyze_text`` would for everything fed so far. Analyzers that saw
+    consecutive pieces of a stream can be combined with :meth:`merge`.
+
+    Text is only scanned up to the last *safe cut* – a whitespace character
+    followed by a different character – since no token, character run or
+    lower-casing context can span one. Memory is bounded by the vocabulary
+    plus the unscanned text before the first and after the last cut. Alert
+    phrases are tracked as open trie states carried from chunk to chunk.
+    """
+
+    def __init__(self, lexicon: Lexicon | None = None) -> None:
+        self.lexicon = lexicon or get_lexicon()
+        self._length = 0
+        self._head: str | None = None  # text before the first cut, kept unscanned for merge()
+        self._counts: Counter = Counter()
+        self._runs = 0
+        self._punct = 0
+        self._tail = ""
+        # alert phrases are walked over the scanned middle (text after the head)
+        # only, since the head may still be glued to text merged in front of it
+        self._phrases: Set[str] = set()
+        self._active: tuple = ()  # open phrase matches at the end of the middle
+        self._lead: List[str] = []  # first phrase_depth-1 tokens of the middle
+
+    def feed(self, chunk: str) -> "VibeAnalyzer":
+        """Consume the next *chunk* of the stream."""
+
+        self._length += len(chunk)
+        self._push(chunk)
+        return self
 
-    words = re.findall(r"[\w']+", text.lower())
-    word_count = len(words)
+    def merge(self, other: "VibeAnalyzer") -> "VibeAnalyzer":
+        """Append the stream seen by *other* to this one (in place)."""
 
-    repetition_rate = _calc_repetition_rate(words)
-    keysmash_hits = len(_RE_REPEATING_CHAR.findall(text)) + len(_detect_keysmash(text))
-    punct_overload = len(_RE_REPEATING_PUNCT.findall(text))
-    sugar_hits = sum(1 for w in words if w in PAPIAMENTU_SUGAR_WORDS)
-    palindrome_hits = sum(1 for w in words if len(w) > 2 and w == w[::-1])
+        if other.lexicon.digest != self.lexicon.digest:
+            raise ValueError("cannot merge analyzers built with different lexicons")
+        self._length += other._length
+        if other._head is None:
+            self._push(other._tail)
+            return self
+        self._push(other._head)
+        # other's head ends on a safe cut, so everything pending here is complete
+        if self._head is None:
+            self._head = self._tail
+        else:
+            self._scan(self._tail)
+        lex = self.lexicon
+        if lex.phrase_depth:
+            # phrases running from here into other's scanned text
+            found, active = lex.match_phrases(other._lead, self._active)
+            self._phrases |= found
+            self._phrases |= other._phrases
+            self._active = active if len(other._lead) < lex.phrase_depth - 1 else other._active
+            self._lead.extend(other._lead[: lex.phrase_depth - 1 - len(self._lead)])
+        self._counts.update(other._counts)
+        self._runs += other._runs
+        self._punct += other._punct
+        self._tail = other._tail
+        return self
 
-    # threshold alert detection
-    counts = Counter(words)
-    alert_tokens = [tok for tok, c in counts.items() if c >= _ALERT_THRESHOLD]
+    def report(self) -> VibeReport:
+        """Return the :class:`VibeReport` for all text fed so far."""
+
+        counts: Counter = Counter()
+        runs, punct = self._runs, self._punct
+        if self._head:
+            head_words, head_runs, head_punct = _scan_segment(self._head)
+            counts.update(head_words)
+            runs += head_runs
+            punct += head_punct
+        counts.update(self._counts)
+        tail_words, tail_runs, tail_punct = _scan_segment(self._tail)
+        counts.update(tail_words)
+        return _report_from_counts(
+            self._length,
+            counts,
+            runs + tail_runs,
+            punct + tail_punct,
+            self.lexicon,
+            self._report_phrases(head_words if self._head else [], tail_words),
+        )
+
+    # ------------------------------------------------------------- internals
+    def _push(self, text: str) -> None:
+        start = len(self._tail)
+        buf = self._tail + text
+        if self._head is None:
+            m = _RE_SAFE_CUT.search(buf, max(start - 1, 0))
+            if m is None:
+                self._tail = buf
+                return
+            self._head = buf[: m.end()]
+            buf, start = buf[m.end() :], 1
+        cut = _last_cut(buf, start)
+        if cut:
+            self._scan(buf[:cut])
+            buf = buf[cut:]
+        self._tail = buf
+
+    def _report_phrases(self, head_words: List[str], tail_words: List[str]) -> Set[str]:
+        lex = self.lexicon
+        if not lex.phrase_depth:
+            return self._phrases
+        # the scanned middle was walked on its own; stitch head -> lead -> tail
+        head_found, active = lex.match_phrases(head_words)
+        lead_found, lead_active = lex.match_phrases(self._lead, active)
+        if len(self._lead) < lex.phrase_depth - 1:
+            active = lead_active  # the whole middle is in the lead
+        else:
+            active = self._active
+        tail_found, _ = lex.match_phrases(tail_words, active)
+        return self._phrases | head_found | lead_found | tail_found
+
+    def _scan(self, segment: str) -> None:
+        words, runs, punct = _scan_segment(segment)
+        self._counts.update(words)
+        self._runs += runs
+        self._punct += punct
+        lex = self.lexicon
+        if lex.phrase_depth:
+            found, self._active = lex.match_phrases(words, self._active)
+            self._phrases |= found
+            need = lex.phrase_depth - 1 - len(self._lead)
+            if need > 0:
+                self._lead.extend(words[:need])
+
+
+def analyze_corpus(
+    sources: Iterable[Union[str, os.PathLike]] = (),
+    *,
+    text: Iterable[str] = (),
+    workers: int | None = None,
+    shard_size: int = _SHARD_BYTES,
+) -> VibeReport:
+    """Analyze a large corpus on several cores and return one :class:`VibeReport`.
+
+    *sources* yields file names, as ``str`` or any :class:`os.PathLike`; each
+    file is read as UTF-8 (invalid bytes dropped, line endings untouched).
+    In-memory strings go in *text* instead and are analysed after the files.
+    The result equals :func:`analyze_text` on all files, then all *text*,
+    concatenated in order.
+
+    Files are split into byte-range shards of about *shard_size* and text is
+    batched to a similar size; each shard is scanned by a :class:`VibeAnalyzer`
+    in a worker process and the partial analyzers are merged in order, so
+    repetition rate and alert tokens stay exact. ``workers=1`` runs inline.
+    """
+
+    if isinstance(sources, (str, os.PathLike)):
+        sources = [sources]
+    if isinstance(text, str):
+        text = [text]
+    workers = workers or os.cpu_count() or 1
+    lexicon = get_lexicon()
+    shards = _iter_shards(sources, text, shard_size)
+    total = VibeAnalyzer(lexicon)
+    if workers <= 1:
+        for shard in shards:
+            total.merge(_analyze_shard(shard, lexicon))
+        return total.report()
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=set_lexicon, initargs=(lexicon,)
+    ) as pool:
+        for partial in _ordered_map(pool, _analyze_shard, shards, 2 * workers):
+            total.merge(partial)
+    return total.report()
+
+
+# ---------------------------------------------------------------------------
+# helpers
+# ---------------------------------------------------------------------------
+
+def _content_key(text: str, lexicon: Lexicon) -> str:
+    h = hashlib.sha256(lexicon.digest.encode("ascii"))
+    h.update(text.encode("utf-8", "surrogatepass"))
+    return h.hexdigest()
+
+
+def _scan_disk_tier(directory: Path) -> Iterator[Tuple[int, int, str]]:
+    """``(size, mtime_ns, path)`` of every cached report under *directory*."""
+
+    for sub in os.scandir(directory):
+        if not sub.is_dir():
+            continue
+        for entry in os.scandir(sub.path):
+            if entry.name.endswith(".json"):
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue  # pruned meanwhile
+                yield st.st_size, st.st_mtime_ns, entry.path
+
+
+def _report_cost(report: VibeReport) -> int:
+    # rough footprint: fixed-size fields plus the alert token strings
+    return _REPORT_BASE_BYTES + sum(len(t) + 50 for t in report.alert_tokens)
+
+
+def _analyze_counted(text: str, lexicon: Lexicon) -> VibeReport:
+    words, runs, punct = _scan_segment(text)
+    phrases = lexicon.match_phrases(words)[0] if lexicon.phrase_depth else ()
+    return _report_from_counts(len(text), Counter(words), runs, punct, lexicon, phrases)
+
+
+def _scan_segment(text: str) -> Tuple[List[str], int, int]:
+    """Return ``(words, repeating-char runs, punctuation runs)`` for *text*."""
+
+    runs = _RE_REPEATING_CHAR.findall(text)  # one captured char per maximal run
+    return (
+        _RE_WORD.findall(text.lower()),
+        len(runs),
+        sum(map(_PUNCT_RUN_CHARS.__contains__, runs)),
+    )
+
+
+def _report_from_counts(
+    length: int,
+    counts: Counter,
+    runs: int,
+    punct: int,
+    lexicon: Lexicon,
+    phrases: Iterable[str] = (),
+) -> VibeReport:
+    # Every [a-z] keysmash candidate lies inside a single [\w']+ token, so all
+    # token-level metrics can be read off the word frequency table.
+    word_count = 0
+    repeated_tokens = 0
+    keysmash_hits = runs
+    sugar_hits = 0
+    palindrome_hits = 0
+    alert_tokens: List[str] = []
+    traits = lexicon.token_traits
+    for tok, c in counts.items():
+        t = traits(tok)
+        word_count += c
+        if c > 1:
+            repeated_tokens += c
+        if c >= _ALERT_THRESHOLD:
+            alert_tokens.append(tok)
+        keysmash_hits += t[0] * c
+        sugar_hits += t[1] * c
+        palindrome_hits += t[2] * c
 
     return VibeReport(
-        length=len(text),
+        length=length,
         word_count=word_count,
-        repetition_rate=repetition_rate,
+        repetition_rate=repeated_tokens / word_count if word_count else 0.0,
         keysmash_hits=keysmash_hits,
-        punct_overload=punct_overload,
+        punct_overload=punct,
         sugar_hits=sugar_hits,
         palindrome_hits=palindrome_hits,
-        alert_tokens=alert_tokens,
+        alert_tokens=tuple(alert_tokens) + _phrase_alerts(lexicon, phrases, alert_tokens),
     )
 
 
-# ---------------------------------------------------------------------------
-# helpers
-# ---------------------------------------------------------------------------
+def _phrase_alerts(lexicon: Lexicon, phrases: Iterable[str], alert_tokens: List[str]) -> Tuple[str, ...]:
+    """Matched alert phrases in lexicon order, skipping ones already alerted."""
+
+    if not phrases:
+        return ()
+    found = set(phrases).difference(alert_tokens)
+    return tuple(p for p in lexicon.alert_phrases if p in found)
+
+
+def _last_cut(buf: str, start: int) -> int:
+    """Return the last safe split offset in ``buf[start:]`` (0 if none)."""
+
+    for i in range(len(buf) - 1, max(start, 1) - 1, -1):
+        prev = buf[i - 1]
+        if prev.isspace() and buf[i] != prev:
+            return i
+    return 0
+
+
+# ------------------------------------------------------------------ corpus
+
+_Shard = Union[List[str], Tuple[str, int, int]]  # text batch or (path, start, end)
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def _iter_shards(
+    sources: Iterable[Union[str, os.PathLike]], texts: Iterable[str], shard_size: int
+) -> Iterator[_Shard]:
+    for src in sources:
+        path = os.fspath(src)
+        size = os.path.getsize(path)
+        for start in range(0, size, shard_size):
+            yield (path, start, min(start + shard_size, size))
+    batch: List[str] = []
+    batched = 0
+    for chunk in texts:
+        batch.append(chunk)
+        batched += len(chunk)
+        if batched >= shard_size:
+            yield batch
+            batch, batched = [], 0
+    if batch:
+        yield batch
+
+
+def _analyze_shard(shard: _Shard, lexicon: Lexicon | None = None) -> VibeAnalyzer:
+    analyzer = VibeAnalyzer(lexicon)
+    if isinstance(shard, list):
+        for text in shard:
+            analyzer.feed(text)
+        return analyzer
+    text = _read_utf8_range(*shard)
+    for i in range(0, len(text), _FEED_CHARS):
+        analyzer.feed(text[i : i + _FEED_CHARS])
+    return analyzer
+
+
+def _read_utf8_range(path: str, start: int, end: int) -> str:
+    """Decode bytes ``[start, end)`` of *path*, both ends nudged past UTF-8 continuation bytes.
+
+    Neighbouring shards apply the same rule, so no character is split or
+    counted twice and the pieces decode exactly like the whole file.
+    """
+
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start + 3)
+    lo = 0
+    if start:
+        while lo < 3 and lo < len(data) and data[lo] & 0xC0 == 0x80:
+            lo += 1
+    hi = end - start
+    limit = min(hi + 3, len(data))
+    while hi < limit and data[hi] & 0xC0 == 0x80:
+        hi += 1
+    return data[lo:hi].decode("utf-8", errors="ignore")
+
+
+def _ordered_map(
+    pool: Executor, fn: Callable[[_T], _R], items: Iterable[_T], window: int
+) -> Iterator[_R]:
+    """Like ``pool.map`` but keeps at most *window* tasks in flight."""
 
-def _calc_repetition_rate(words: List[str]) -> float:
-    if not words:
-        return 0.0
-    counts = Counter(words)
-    repeated_tokens = sum(c for c in counts.values() if c > 1)
-    return repeated_tokens / len(words)
-
-
-def _detect_keysmash(text: str) -> List[str]:
-    # sequence of random letters that are not common english tokens length >=6
-    candidates = _RE_KEYSMASH.findall(text.lower())
-    filtered: List[str] = []
-    for c in candidates:
-        # skip if word appears in dictionary of sugar words or common english? simple filter length>6 & not vowels heavy
-        if len(c) >= 6 and not c in PAPIAMENTU_SUGAR_WORDS:
-            # heuristically filter typical keysmash patterns repeated substring sequences
-            if re.search(r"sksk|asdf|dfgh|ghjk", c):
-                filtered.append(c)
-            elif len(set(c)) > 4 and any(ch.isalpha() for ch in c):
-                filtered.append(c)
-    return filtered
\ No newline at end of file
+    pending: deque = deque()
+    for item in items:
+        pending.append(pool.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()